@@ -16,7 +16,19 @@ This base class provides:
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import MISSING, dataclass, field, fields
+from functools import lru_cache
+import asyncio
+import hashlib
+import itertools
+import json
+import sys
+import threading
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Type
 from app.core.contracts import (
     NodeInput, 
     NodeOutput, 
@@ -25,11 +37,148 @@ from app.core.contracts import (
     LLMConfig,
 )
 from app.core.tool_registry import tool_registry
-from app.schema import ActionItem, ActionCategory, ActionSeverity, AgentState
+from langchain_core.messages import HumanMessage, SystemMessage
+from app.schema import ActionCategory, ActionSeverity, AgentState, start_pass
 from app.utils.simulation import sim
 import os
 
 
+# =============================================================================
+# LLM Response Cache
+# =============================================================================
+
+LLM_CACHE_MAX_ENTRIES = 512
+
+_llm_cache: "OrderedDict[str, str]" = OrderedDict()
+_llm_cache_lock = threading.Lock()
+
+
+def _llm_cache_key(sys_prompt: Optional[str], prompt: str, llm: Any, temperature: float) -> str:
+    """Stable hash of everything that determines an LLM response."""
+    model = (
+        getattr(llm, "model", None)
+        or getattr(llm, "model_name", None)
+        or getattr(llm, "model_id", None)
+    )
+    raw = f"{sys_prompt or ''}|{prompt}|{model}|{temperature}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _llm_cache_get(key: str) -> Optional[str]:
+    with _llm_cache_lock:
+        value = _llm_cache.get(key)
+        if value is not None:
+            _llm_cache.move_to_end(key)
+        return value
+
+
+def _llm_cache_put(key: str, value: str):
+    with _llm_cache_lock:
+        _llm_cache[key] = value
+        _llm_cache.move_to_end(key)
+        if len(_llm_cache) > LLM_CACHE_MAX_ENTRIES:
+            _llm_cache.popitem(last=False)
+
+
+# =============================================================================
+# Tool Guard
+# =============================================================================
+
+_TOOL_NOT_ALLOWED = "Tool '{tool}' not in available_tools for {node}"
+
+
+@lru_cache(maxsize=256)
+def _tool_not_allowed(tool_name: str, node_name: str) -> ToolResult:
+    """Shared failure result for a tool a node isn't permitted to call."""
+    return ToolResult(
+        tool_name=tool_name,
+        success=False,
+        error=_TOOL_NOT_ALLOWED.format(tool=tool_name, node=node_name),
+    )
+
+
+# =============================================================================
+# State View
+# =============================================================================
+
+# NodeInput attribute -> AgentState key, where the names differ
+_STATE_ALIASES = {
+    "existing_action_items": "action_items",
+    "existing_notes": "verification_notes",
+}
+
+# NodeInput defaults, applied when the state lacks a key
+_STATE_DEFAULTS = {
+    f.name: (f.default_factory if f.default is MISSING else (lambda v=f.default: v))
+    for f in fields(NodeInput)
+    if f.default is not MISSING or f.default_factory is not MISSING
+}
+_STATE_DEFAULTS["application_data"] = dict
+
+
+class _StateView:
+    """
+    Read-only NodeInput-compatible view over AgentState.
+    
+    Attribute reads go straight to the state dict, so nothing is copied
+    per node run. Missing keys fall back to the NodeInput defaults.
+    """
+    __slots__ = ("_s",)
+    
+    def __init__(self, state: AgentState):
+        self._s = state
+    
+    def __getattr__(self, name: str) -> Any:
+        value = self._s.get(_STATE_ALIASES.get(name, name))
+        if value is None and name in _STATE_DEFAULTS:
+            return _STATE_DEFAULTS[name]()
+        return value
+
+
+# =============================================================================
+# Per-Invocation Context
+# =============================================================================
+
+@dataclass(slots=True)
+class NodeRunCtx:
+    """Mutable state for a single node run (tool log and audit notes)."""
+    tool_results: List[Optional[ToolResult]] = field(default_factory=list)
+    notes: List[str] = field(default_factory=list)
+    # Tool calls run concurrently (asyncio.to_thread); the lock keeps
+    # each result in its claimed slot once the presized list runs out
+    slots: Iterator[int] = field(default_factory=itertools.count)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    
+    def add_tool_result(self, result: ToolResult):
+        """Fill the next slot, growing the presized list when it runs out."""
+        with self.lock:
+            slot = next(self.slots)
+            if slot >= len(self.tool_results):
+                self.tool_results.extend([None] * (slot + 1 - len(self.tool_results)))
+            self.tool_results[slot] = result
+    
+    def finish_tool_results(self) -> List[ToolResult]:
+        """Drop unused presized slots and return the tool log."""
+        results = self.tool_results
+        while results and results[-1] is None:
+            results.pop()
+        return results
+
+
+# Each LangGraph task (and asyncio.to_thread worker) runs in its own copy
+# of the context, so one node instance can serve parallel branches.
+_run_ctx: ContextVar[NodeRunCtx] = ContextVar("node_run_ctx")
+
+
+def _current_ctx() -> NodeRunCtx:
+    """Context of the running node, or a fresh one outside __call__."""
+    ctx = _run_ctx.get(None)
+    if ctx is None:
+        ctx = NodeRunCtx()
+        _run_ctx.set(ctx)
+    return ctx
+
+
 class BaseNode(ABC):
     """
     Abstract base class for workflow nodes.
@@ -51,13 +200,39 @@ class BaseNode(ABC):
                 # Your logic here
                 result = self.call_tool("verify_pan", {"pan": input.application_data["pan"]})
                 ...
+    
+    Nodes dominated by network I/O can override aprocess() instead and
+    await call_tool_async() there.
+    
+    Per-run tool results and notes live in a NodeRunCtx bound to the
+    current task, not on the instance, so nodes are safe to run
+    concurrently.
     """
     
+    __slots__ = (
+        "_config",
+        "_skip_default",
+        "_skip_version",
+        "_active_failures",
+        "_failures_version",
+        "_logger",
+    )
+    
+    def __init_subclass__(cls, **kwargs):
+        """Memoize each subclass's get_config() - configs are static and never mutated."""
+        super().__init_subclass__(**kwargs)
+        get_config = cls.__dict__.get("get_config")
+        if isinstance(get_config, classmethod):
+            cls.get_config = classmethod(lru_cache(maxsize=None)(get_config.__func__))
+    
     def __init__(self, config: Optional[NodeConfig] = None):
         """Initialize node with optional config override."""
         self._config = config or self.get_config()
-        self._tool_results: List[ToolResult] = []
-        self._verification_notes: List[str] = []
+        self._skip_default = sim.should_skip(self._config.simulation_key)
+        self._skip_version = sim.version
+        self._active_failures = self._load_active_failures()
+        self._failures_version = sim.version
+        self._logger = None  # Created on first _log()
     
     @classmethod
     @abstractmethod
@@ -65,7 +240,8 @@ class BaseNode(ABC):
         """
         Return the default configuration for this node.
         
-        Must be implemented by subclasses.
+        Must be implemented by subclasses. The result is cached per class
+        (see __init_subclass__), so every caller shares one instance.
         """
         pass
     
@@ -84,6 +260,22 @@ class BaseNode(ABC):
         """
         pass
     
+    async def aprocess(self, input: NodeInput) -> NodeOutput:
+        """
+        Async processing logic for the node.
+        
+        Override this (using call_tool_async) in nodes that issue network
+        bound tool calls so they don't block the event loop. The default
+        runs the sync process() in a worker thread.
+        
+        Args:
+            input: Standardized node input
+            
+        Returns:
+            Standardized node output
+        """
+        return await asyncio.to_thread(self.process, input)
+    
     @property
     def config(self) -> NodeConfig:
         """Get node configuration."""
@@ -116,21 +308,17 @@ class BaseNode(ABC):
             ToolResult with success/failure and data
         """
         # Check if tool is allowed for this node
-        if tool_name not in self._config.available_tools:
-            result = ToolResult(
-                tool_name=tool_name,
-                success=False,
-                error=f"Tool '{tool_name}' not in available_tools for {self.name}"
-            )
-            self._tool_results.append(result)
+        if tool_name not in self._config.available_tools_set:
+            result = _tool_not_allowed(tool_name, self.name)
+            _current_ctx().add_tool_result(result)
             return result
         
         # Determine mock mode
         if use_mock is None:
-            use_mock = sim.should_skip(self._config.simulation_key)
+            use_mock = self.should_skip_checks()
         
         result = tool_registry.call(tool_name, inputs, use_mock=use_mock)
-        self._tool_results.append(result)
+        _current_ctx().add_tool_result(result)
         
         return result
     
@@ -141,20 +329,16 @@ class BaseNode(ABC):
         use_mock: Optional[bool] = None
     ) -> ToolResult:
         """Call an async tool."""
-        if tool_name not in self._config.available_tools:
-            result = ToolResult(
-                tool_name=tool_name,
-                success=False,
-                error=f"Tool '{tool_name}' not in available_tools for {self.name}"
-            )
-            self._tool_results.append(result)
+        if tool_name not in self._config.available_tools_set:
+            result = _tool_not_allowed(tool_name, self.name)
+            _current_ctx().add_tool_result(result)
             return result
         
         if use_mock is None:
-            use_mock = sim.should_skip(self._config.simulation_key)
+            use_mock = self.should_skip_checks()
         
         result = await tool_registry.call_async(tool_name, inputs, use_mock=use_mock)
-        self._tool_results.append(result)
+        _current_ctx().add_tool_result(result)
         
         return result
     
@@ -166,14 +350,22 @@ class BaseNode(ABC):
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
         **kwargs
     ) -> Optional[str]:
         """
         Call the configured LLM.
         
+        Messages are ordered static-first so provider-side prompt caching
+        can reuse the prefix: the system prompt is sent byte-identical on
+        every call, then the prompt, then any per-request data from
+        `context` as a trailing JSON block. Keep merchant-specific values
+        out of the system prompt and the prompt - pass them via `context`.
+        
         Args:
-            prompt: User prompt
+            prompt: User prompt (instructions)
             system_prompt: Override system prompt
+            context: Per-request data, appended as a separate message
             **kwargs: Additional LLM parameters
             
         Returns:
@@ -185,27 +377,53 @@ class BaseNode(ABC):
         
         try:
             from app.utils.llm_factory import get_llm
-            from langchain_core.messages import HumanMessage, SystemMessage
             
             llm = get_llm()
             messages = []
             
             # Add system prompt if provided
             sys_prompt = system_prompt or self._config.llm.system_prompt
-            if sys_prompt:
-                messages.append(SystemMessage(content=sys_prompt))
+            sys_message = self._system_message(system_prompt)
+            if sys_message is not None:
+                messages.append(sys_message)
             
             messages.append(HumanMessage(content=prompt))
             
+            # Dynamic data goes last so the static prefix stays cacheable
+            context_text = ""
+            if context:
+                context_text = json.dumps(context, indent=2, default=str)
+                messages.append(HumanMessage(content=context_text))
+            
+            # Only deterministic (temperature 0) responses are cacheable
+            cache_key = None
+            if self._config.llm.cache_enabled and self._config.llm.temperature == 0:
+                cache_key = _llm_cache_key(
+                    sys_prompt, f"{prompt}|{context_text}", llm, self._config.llm.temperature
+                )
+                cached = _llm_cache_get(cache_key)
+                if cached is not None:
+                    self._add_note("LLM cache hit")
+                    return cached
+            
             response = llm.invoke(messages)
             self._add_note(f"LLM call successful ({len(response.content)} chars)")
             
+            if cache_key is not None:
+                _llm_cache_put(cache_key, response.content)
+            
             return response.content
             
         except Exception as e:
             self._add_note(f"LLM call failed: {str(e)}")
             return None
     
+    def _system_message(self, system_prompt: Optional[str]) -> Optional[SystemMessage]:
+        """Config's shared SystemMessage, or a per-call one for an override."""
+        if system_prompt:
+            return SystemMessage(content=system_prompt)
+        return self._config.llm.system_message
+    
     # =========================================================================
     # Action Item Helpers
     # =========================================================================
@@ -225,32 +443,64 @@ class BaseNode(ABC):
         """
         Create a standardized action item.
         
-        Returns dict representation for state updates.
+        Returns dict representation for state updates. The dict is built
+        directly with the same keys as ActionItem.model_dump() - the model
+        would be discarded immediately, so validation is skipped.
+        
+        category/severity may be enum members or their string values; they
+        are stored interned so severity checks downstream compare by identity.
         """
-        item = ActionItem(
-            category=category,
-            severity=severity,
-            title=title,
-            description=description,
-            suggestion=suggestion,
-            field_to_update=field_to_update,
-            current_value=current_value,
-            required_format=required_format,
-            sample_content=sample_content,
-        )
-        return item.model_dump()
+        return {
+            "id": str(uuid.uuid4())[:8],
+            "category": sys.intern(getattr(category, "value", category)),
+            "severity": sys.intern(getattr(severity, "value", severity)),
+            "title": title,
+            "description": description,
+            "suggestion": suggestion,
+            "field_to_update": field_to_update,
+            "current_value": current_value,
+            "required_format": required_format,
+            "sample_content": sample_content,
+            "created_at": datetime.now(),
+            "resolved": False,
+            "resolved_at": None,
+        }
     
     # =========================================================================
     # Simulation Helpers
     # =========================================================================
     
     def should_skip_checks(self) -> bool:
-        """Check if this node should skip real checks (force success)."""
-        return sim.should_skip(self._config.simulation_key)
+        """
+        Check if this node should skip real checks (force success).
+        
+        Cached per instance; recomputed only when runtime flags change.
+        """
+        if self._skip_version != sim.version:
+            self._skip_default = sim.should_skip(self._config.simulation_key)
+            self._skip_version = sim.version
+        return self._skip_default
     
     def should_simulate_failure(self, failure_type: str) -> bool:
-        """Check if a specific failure should be simulated."""
-        return sim.should_fail(f"{self._config.simulation_key}_{failure_type}")
+        """
+        Check if a specific failure should be simulated.
+        
+        The node's active failures are looked up once per flag change, so
+        each check is a set probe rather than a flag/env lookup.
+        """
+        if self._failures_version != sim.version:
+            self._active_failures = self._load_active_failures()
+            self._failures_version = sim.version
+        return failure_type in self._active_failures
+    
+    def _load_active_failures(self) -> frozenset:
+        """Active failure scenarios for this node, without the node prefix."""
+        prefix = f"{self._config.simulation_key}_"
+        return frozenset(
+            scenario[len(prefix):]
+            for scenario in sim.ALL_SCENARIOS
+            if scenario.startswith(prefix) and sim.should_fail(scenario)
+        )
     
     # =========================================================================
     # Note/Logging Helpers
@@ -258,46 +508,45 @@ class BaseNode(ABC):
     
     def _add_note(self, note: str):
         """Add a verification note."""
-        self._verification_notes.append(note)
+        _current_ctx().notes.append(note)
     
-    def _log(self, message: str):
-        """Log a message (with node name prefix)."""
-        from app.utils.logger import get_logger
-        logger = get_logger(f"node.{self._config.node_name}")
-        logger.info(message)
+    def _log(self, message: str, *args: Any):
+        """
+        Log a message (with node name prefix).
+        
+        Extra args are %-formatted by the logger, only if INFO is enabled.
+        """
+        if self._logger is None:
+            from app.utils.logger import get_logger
+            self._logger = get_logger(f"node.{self._config.node_name}")
+        self._logger.info(message, *args)
     
     # =========================================================================
     # State Conversion
     # =========================================================================
     
     @classmethod
-    def from_state(cls, state: AgentState) -> NodeInput:
+    def from_state(cls, state: AgentState) -> _StateView:
         """
-        Convert AgentState to NodeInput.
+        Wrap AgentState for process()/aprocess().
         
-        Helper for existing LangGraph integration.
+        Helper for existing LangGraph integration. Returns a zero-copy
+        view that reads like a NodeInput rather than building one, so
+        its lists and dicts are the live state - copy before mutating.
         """
-        return NodeInput(
-            application_data=state.get("application_data", {}),
-            merchant_id=state.get("merchant_id"),
-            stage=state.get("stage", "INPUT"),
-            is_auth_valid=state.get("is_auth_valid", False),
-            is_doc_verified=state.get("is_doc_verified", False),
-            is_bank_verified=state.get("is_bank_verified", False),
-            is_website_compliant=state.get("is_website_compliant", False),
-            existing_action_items=state.get("action_items", []),
-            existing_notes=state.get("verification_notes", []),
-        )
+        return _StateView(state)
     
-    def __call__(self, state: AgentState) -> Dict[str, Any]:
+    async def __call__(self, state: AgentState) -> Dict[str, Any]:
         """
         Make node callable for LangGraph.
         
         This bridges the new architecture with existing LangGraph setup.
+        The node is a coroutine, so run the graph with ainvoke() - parallel
+        branches then overlap their I/O on the event loop.
         """
-        # Reset per-invocation state
-        self._tool_results = []
-        self._verification_notes = []
+        # Fresh per-invocation state, scoped to this task
+        ctx = NodeRunCtx(tool_results=[None] * self._config.expected_tool_calls)
+        _run_ctx.set(ctx)
         
         # Convert state to input
         input_data = self.from_state(state)
@@ -305,15 +554,21 @@ class BaseNode(ABC):
         self._log("Processing...")
         
         # Run the node logic
-        output = self.process(input_data)
+        output = await self.aprocess(input_data)
         
         # Add tool results and notes to output
-        output.tool_results = self._tool_results
-        output.verification_notes = self._verification_notes + output.verification_notes
+        output.tool_results = ctx.finish_tool_results()
+        if ctx.notes:
+            # Extend the run's own list in place - no new list, and the
+            # node's returned list is left untouched
+            ctx.notes.extend(output.verification_notes)
+            output.verification_notes = ctx.notes
         
-        self._log(f"Complete. Actions: {len(output.action_items)}, Notes: {len(output.verification_notes)}")
+        self._log("Complete. Actions: %d, Notes: %d", len(output.action_items), len(output.verification_notes))
         
         # Convert to state dict for LangGraph
+        if self._config.starts_pass:
+            return start_pass(output.to_state_dict(), state)
         return output.to_state_dict()
 
 
@@ -321,6 +576,8 @@ def create_node_function(node_class: Type[BaseNode]):
     """
     Create a LangGraph-compatible function from a BaseNode class.
     
+    The returned callable is async; LangGraph awaits it under ainvoke().
+    
     Usage:
         input_parser_node = create_node_function(InputParserNode)
     """
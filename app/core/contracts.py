@@ -9,10 +9,13 @@ Clear inputs and outputs enable:
 4. Documentation auto-generation
 """
 
-from typing import Any, Dict, List, Optional, Callable, TypeVar, Generic
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, List, Mapping, Optional, Callable, TypeVar, Generic
+from pydantic import BaseModel, Field, field_validator
 from enum import Enum
 from datetime import datetime
+import re
 
 
 # =============================================================================
@@ -55,7 +58,8 @@ class ToolDefinition(BaseModel):
     )
 
 
-class ToolResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ToolResult:
     """
     Result from a tool execution.
     
@@ -63,10 +67,14 @@ class ToolResult(BaseModel):
     - Consistent error handling
     - LLM interpretation of results
     - Audit logging
+    
+    Frozen slotted dataclass - built on every tool call from trusted values.
+    Static mock and dispatch-error results are shared between callers, so
+    their data is read-only too; use dataclasses.replace() to derive one.
     """
     tool_name: str
     success: bool
-    data: Optional[Dict[str, Any]] = None
+    data: Optional[Mapping[str, Any]] = None
     error: Optional[str] = None
     execution_time_ms: Optional[int] = None
     was_mocked: bool = False
@@ -76,6 +84,9 @@ class ToolResult(BaseModel):
 # Node Configuration
 # =============================================================================
 
+# str.format-style placeholder, e.g. "{merchant_name}"
+_PLACEHOLDER_RE = re.compile(r"\{[A-Za-z_][A-Za-z0-9_]*\}|\{\}")
+
 class LLMConfig(BaseModel):
     """Configuration for LLM usage within a node."""
     enabled: bool = False
@@ -84,9 +95,31 @@ class LLMConfig(BaseModel):
     temperature: float = 0.0
     max_tokens: int = 1024
     
+    # Reuse responses for identical prompts (only when temperature == 0)
+    cache_enabled: bool = True
+    
     # Prompt templates (can be overridden)
+    # Must be static text - per-request data goes in call_llm(context=...)
     system_prompt: Optional[str] = None
     
+    @field_validator("system_prompt")
+    @classmethod
+    def _system_prompt_is_static(cls, v: Optional[str]) -> Optional[str]:
+        """Reject format placeholders, which would vary the cached prefix."""
+        if v and _PLACEHOLDER_RE.search(v):
+            raise ValueError(
+                "system_prompt must be static; pass dynamic values via call_llm(context=...)"
+            )
+        return v
+    
+    @cached_property
+    def system_message(self):
+        """Shared SystemMessage for system_prompt, built once per config."""
+        if not self.system_prompt:
+            return None
+        from langchain_core.messages import SystemMessage
+        return SystemMessage(content=self.system_prompt)
+
 
 class NodeConfig(BaseModel):
     """
@@ -104,12 +137,20 @@ class NodeConfig(BaseModel):
     
     # Stage in the workflow
     stage: str = Field(default="UNKNOWN", description="INPUT|DOCS|BANK|COMPLIANCE|FINAL")
+    starts_pass: bool = Field(
+        default=False,
+        description="First node of a verification pass - its output replaces earlier passes' items, notes and error"
+    )
     
     # Tools this node can use
     available_tools: List[str] = Field(
         default_factory=list,
         description="Tool names this node can call"
     )
+    expected_tool_calls: int = Field(
+        default=0,
+        description="Typical tool calls per run (presizes the tool log)"
+    )
     
     # LLM configuration
     llm: LLMConfig = Field(default_factory=LLMConfig)
@@ -123,13 +164,19 @@ class NodeConfig(BaseModel):
     # Retry behavior
     max_retries: int = 3
     retry_delay_seconds: float = 1.0
+    
+    @cached_property
+    def available_tools_set(self) -> frozenset:
+        """available_tools as a frozenset for O(1) membership checks."""
+        return frozenset(self.available_tools)
 
 
 # =============================================================================
 # Node Input/Output Contracts
 # =============================================================================
 
-class NodeInput(BaseModel):
+@dataclass(slots=True)
+class NodeInput:
     """
     Standardized input for all nodes.
     
@@ -137,17 +184,17 @@ class NodeInput(BaseModel):
     - The current state (read-only view)
     - Node-specific configuration
     - Optional context from previous nodes
+    
+    Node inputs/outputs are slotted dataclasses rather than Pydantic models:
+    one of each is built per node run from already-validated state, so
+    validation would be pure overhead.
     """
     # Core data
-    application_data: Dict[str, Any] = Field(
-        ..., description="The merchant application data"
-    )
-    merchant_id: Optional[str] = Field(
-        None, description="Merchant identifier"
-    )
+    application_data: Dict[str, Any]               # The merchant application data
+    merchant_id: Optional[str] = None              # Merchant identifier
     
     # Workflow context
-    stage: str = Field(default="INPUT")
+    stage: str = "INPUT"
     previous_node: Optional[str] = None
     retry_count: int = 0
     
@@ -158,14 +205,12 @@ class NodeInput(BaseModel):
     is_website_compliant: bool = False
     
     # Previous findings (for consultant node)
-    existing_action_items: List[Dict[str, Any]] = Field(default_factory=list)
-    existing_notes: List[str] = Field(default_factory=list)
-    
-    class Config:
-        extra = "allow"  # Allow extra fields from AgentState
+    existing_action_items: List[Dict[str, Any]] = field(default_factory=list)
+    existing_notes: List[str] = field(default_factory=list)
 
 
-class NodeOutput(BaseModel):
+@dataclass(slots=True)
+class NodeOutput:
     """
     Standardized output from all nodes.
     
@@ -176,42 +221,31 @@ class NodeOutput(BaseModel):
     - Next step hint (optional routing)
     """
     # What state fields to update
-    state_updates: Dict[str, Any] = Field(
-        default_factory=dict,
-        description="Dict of state fields to update"
-    )
+    state_updates: Dict[str, Any] = field(default_factory=dict)
     
-    # Issues found (if any)
-    action_items: List[Dict[str, Any]] = Field(
-        default_factory=list,
-        description="New action items from this node"
-    )
+    # Issues found (if any) - new action items from this node
+    action_items: List[Dict[str, Any]] = field(default_factory=list)
     
-    # Audit trail
-    verification_notes: List[str] = Field(
-        default_factory=list,
-        description="Notes about what was checked"
-    )
+    # Audit trail - notes about what was checked
+    verification_notes: List[str] = field(default_factory=list)
     
-    # Routing hint
-    next_node: Optional[str] = Field(
-        None,
-        description="Suggested next node (for conditional routing)"
-    )
+    # Routing hint - suggested next node (for conditional routing)
+    next_node: Optional[str] = None
     
-    # Tool execution log
-    tool_results: List[ToolResult] = Field(
-        default_factory=list,
-        description="Results from tools called"
-    )
+    # Tool execution log - results from tools called
+    tool_results: List[ToolResult] = field(default_factory=list)
     
     def to_state_dict(self) -> Dict[str, Any]:
         """
         Convert output to dict for LangGraph state update.
         
-        Merges state_updates with standard fields.
+        Merges state_updates with standard fields. state_updates is only
+        copied when a standard field has to be added to it.
         """
-        result = dict(self.state_updates)
+        if not (self.action_items or self.verification_notes or self.next_node):
+            return self.state_updates
+        
+        result = {**self.state_updates}
         
         if self.action_items:
             result["action_items"] = self.action_items
@@ -5,6 +5,7 @@ from app.core.nodes.input_parser import InputParserNode
 from app.core.nodes.doc_intelligence import DocIntelligenceNode
 from app.core.nodes.bank_verifier import BankVerifierNode
 from app.core.nodes.web_compliance import WebComplianceNode
+from app.core.nodes.aggregator import AggregatorNode
 from app.core.nodes.consultant import ConsultantNode
 from app.core.nodes.finalizer import FinalizerNode
 
@@ -13,6 +14,7 @@ __all__ = [
     "DocIntelligenceNode",
     "BankVerifierNode",
     "WebComplianceNode",
+    "AggregatorNode",
     "ConsultantNode",
     "FinalizerNode",
 ]
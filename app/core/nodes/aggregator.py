@@ -0,0 +1,68 @@
+"""
+Aggregator Node - Joins the parallel verifier branches.
+
+INPUT:
+  - is_doc_verified, is_bank_verified, is_website_compliant
+    (written concurrently by the verifier branches)
+
+OUTPUT:
+  - error_message: cleared when every verifier passed
+  - next_step: "finalizer_node" or "consultant_fixer_node"
+
+TOOLS:
+  - (None)
+"""
+
+from app.core.base_node import BaseNode
+from app.core.contracts import NodeInput, NodeOutput, NodeConfig, LLMConfig
+
+
+class AggregatorNode(BaseNode):
+    """
+    Fan-in point for the document, bank and web compliance verifiers.
+
+    The three verifiers run in parallel after the input parser. This node
+    runs once all of them have finished and decides whether the merchant
+    can be finalized or needs the consultant.
+    """
+
+    @classmethod
+    def get_config(cls) -> NodeConfig:
+        return NodeConfig(
+            node_name="aggregator_node",
+            display_name="Verification Aggregator",
+            description="Joins parallel verifier results and decides routing",
+            stage="COMPLIANCE",
+            available_tools=[],
+            simulation_key="aggregator",
+            llm=LLMConfig(enabled=False),
+        )
+
+    def process(self, input: NodeInput) -> NodeOutput:
+        """
+        Combine verifier flags into a routing decision.
+        """
+        checks = {
+            "Documents": input.is_doc_verified,
+            "Bank": input.is_bank_verified,
+            "Website": input.is_website_compliant,
+        }
+        failed_checks = [name for name, passed in checks.items() if not passed]
+
+        if failed_checks:
+            return NodeOutput(
+                verification_notes=[f"Verification failed: {', '.join(failed_checks)}"],
+                next_node="consultant_fixer_node",
+            )
+
+        return NodeOutput(
+            state_updates={
+                "error_message": None,
+            },
+            verification_notes=["All verifications passed"],
+            next_node="finalizer_node",
+        )
+
+
+# Create callable for LangGraph
+aggregator_node = AggregatorNode()
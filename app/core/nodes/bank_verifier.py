@@ -17,10 +17,80 @@ TOOLS:
   - lookup_ifsc
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 from app.core.base_node import BaseNode
 from app.core.contracts import NodeInput, NodeOutput, NodeConfig, LLMConfig
+from app.core.tools.bank import account_number_format_ok
+from app.core.tools.validation import ifsc_format_ok
 from app.schema import ActionCategory, ActionSeverity
+from types import MappingProxyType
+
+
+# Passing state shared by every success branch - copied per call so runs
+# never share a dict
+_PASSED_STATE = MappingProxyType({
+    "is_bank_verified": True,
+    "stage": "BANK",
+})
+_SKIPPED_NOTE = "Bank verification passed (simulated)"
+
+# Static action item templates - splat into create_action_item()
+_AI_NAME_MISMATCH = MappingProxyType({
+    "category": ActionCategory.BANK,
+    "severity": ActionSeverity.BLOCKING,
+    "title": "Correct bank account holder name",
+    "description": "The name on the bank account does not match the business name.",
+    "suggestion": "Ensure the account holder name matches exactly with your business registration.",
+    "field_to_update": "bank_details.account_holder_name",
+    "required_format": "Full name as it appears on bank account.",
+})
+
+_AI_INVALID_IFSC = MappingProxyType({
+    "category": ActionCategory.BANK,
+    "severity": ActionSeverity.BLOCKING,
+    "title": "Correct IFSC code",
+    "description": "The IFSC code is invalid or does not match any bank branch.",
+    "suggestion": "Verify the IFSC from your cheque book or bank statement.",
+    "field_to_update": "bank_details.ifsc",
+    "required_format": "11 characters: AAAA0BBBBBB (e.g., HDFC0001234)",
+})
+
+_AI_ACCOUNT_CLOSED = MappingProxyType({
+    "category": ActionCategory.BANK,
+    "severity": ActionSeverity.BLOCKING,
+    "title": "Provide active bank account",
+    "description": "The bank account appears to be closed or inactive.",
+    "suggestion": "Please provide details of an active bank account.",
+    "field_to_update": "bank_details.account_number",
+    "required_format": "Active savings or current account.",
+})
+
+_AI_INCOMPLETE = MappingProxyType({
+    "category": ActionCategory.BANK,
+    "severity": ActionSeverity.BLOCKING,
+    "title": "Provide complete bank details",
+    "description": "Bank account number or IFSC code is missing.",
+    "suggestion": "Please provide complete bank account details.",
+    "field_to_update": "bank_details",
+    "required_format": "Account: 9-18 digits. IFSC: 11 chars.",
+})
+
+# description comes from the validate_account_number error
+_AI_BAD_ACCOUNT = MappingProxyType({
+    "category": ActionCategory.BANK,
+    "severity": ActionSeverity.BLOCKING,
+    "title": "Correct account number",
+    "suggestion": "Account number should be 9-18 digits.",
+    "field_to_update": "bank_details.account_number",
+})
+
+# Simulated failure -> (note label, error_message, action item template,
+# bank_details field shown as current_value). Checked in this order.
+_SIMULATED_FAILURES = {
+    "name_mismatch": ("Bank name mismatch", "Penny drop failed: Name mismatch", _AI_NAME_MISMATCH, "account_holder_name"),
+    "invalid_ifsc": ("Invalid IFSC", "Invalid IFSC code", _AI_INVALID_IFSC, "ifsc"),
+    "account_closed": ("Account closed", "Bank account is closed/inactive", _AI_ACCOUNT_CLOSED, "account_number"),
+}
 
 
 class BankVerifierNode(BaseNode):
@@ -52,6 +122,7 @@ class BankVerifierNode(BaseNode):
                 "penny_drop_verify",
                 "lookup_ifsc",
             ],
+            expected_tool_calls=2,
             simulation_key="bank",
             llm=LLMConfig(
                 enabled=False,
@@ -76,139 +147,59 @@ class BankVerifierNode(BaseNode):
         if self.should_skip_checks():
             self._add_note("SIMULATION: Bank checks skipped (force_success)")
             return NodeOutput(
-                state_updates={
-                    "is_bank_verified": True,
-                    "stage": "BANK",
-                },
-                action_items=[],
-                verification_notes=["Bank verification passed (simulated)"],
+                state_updates=dict(_PASSED_STATE),
+                verification_notes=[_SKIPPED_NOTE],
             )
         
         # --- Simulate Failures ---
-        if self.should_simulate_failure("name_mismatch") or holder_name == "FAIL_ME":
-            self._add_note("SIMULATION: Bank name mismatch failure triggered")
-            action_items.append(self.create_action_item(
-                category=ActionCategory.BANK,
-                severity=ActionSeverity.BLOCKING,
-                title="Correct bank account holder name",
-                description="The name on the bank account does not match the business name.",
-                suggestion="Ensure the account holder name matches exactly with your business registration.",
-                field_to_update="bank_details.account_holder_name",
-                current_value=holder_name,
-                required_format="Full name as it appears on bank account.",
-            ))
-            return NodeOutput(
-                state_updates={
-                    "is_bank_verified": False,
-                    "error_message": "Penny drop failed: Name mismatch",
-                    "stage": "BANK",
-                },
-                action_items=action_items,
-            )
-        
-        if self.should_simulate_failure("invalid_ifsc"):
-            self._add_note("SIMULATION: Invalid IFSC failure triggered")
-            action_items.append(self.create_action_item(
-                category=ActionCategory.BANK,
-                severity=ActionSeverity.BLOCKING,
-                title="Correct IFSC code",
-                description="The IFSC code is invalid or does not match any bank branch.",
-                suggestion="Verify the IFSC from your cheque book or bank statement.",
-                field_to_update="bank_details.ifsc",
-                current_value=ifsc,
-                required_format="11 characters: AAAA0BBBBBB (e.g., HDFC0001234)",
-            ))
-            return NodeOutput(
-                state_updates={
-                    "is_bank_verified": False,
-                    "error_message": "Invalid IFSC code",
-                    "stage": "BANK",
-                },
-                action_items=action_items,
-            )
-        
-        if self.should_simulate_failure("account_closed"):
-            self._add_note("SIMULATION: Account closed failure triggered")
-            action_items.append(self.create_action_item(
-                category=ActionCategory.BANK,
-                severity=ActionSeverity.BLOCKING,
-                title="Provide active bank account",
-                description="The bank account appears to be closed or inactive.",
-                suggestion="Please provide details of an active bank account.",
-                field_to_update="bank_details.account_number",
-                current_value=account_number,
-                required_format="Active savings or current account.",
-            ))
-            return NodeOutput(
-                state_updates={
-                    "is_bank_verified": False,
-                    "error_message": "Bank account is closed/inactive",
-                    "stage": "BANK",
-                },
-                action_items=action_items,
-            )
+        scenario = "name_mismatch" if holder_name == "FAIL_ME" else next(
+            (key for key in _SIMULATED_FAILURES if self.should_simulate_failure(key)), None
+        )
+        if scenario:
+            label, error_message, template, field = _SIMULATED_FAILURES[scenario]
+            self._add_note(f"SIMULATION: {label} failure triggered")
+            return self._failure(error_message, [
+                self.create_action_item(**template, current_value=bank_details.get(field, "")),
+            ])
         
         # --- Real Validation ---
         
         # Check for missing details
         if not account_number or not ifsc:
-            action_items.append(self.create_action_item(
-                category=ActionCategory.BANK,
-                severity=ActionSeverity.BLOCKING,
-                title="Provide complete bank details",
-                description="Bank account number or IFSC code is missing.",
-                suggestion="Please provide complete bank account details.",
-                field_to_update="bank_details",
-                required_format="Account: 9-18 digits. IFSC: 11 chars.",
-            ))
-            return NodeOutput(
-                state_updates={
-                    "is_bank_verified": False,
-                    "error_message": "Incomplete bank details",
-                    "stage": "BANK",
-                },
-                action_items=action_items,
-            )
+            return self._failure("Incomplete bank details", [self.create_action_item(**_AI_INCOMPLETE)])
         
-        # Validate IFSC format
-        ifsc_result = self.call_tool("validate_ifsc", {"ifsc": ifsc})
-        if ifsc_result.success and ifsc_result.data:
-            if not ifsc_result.data.get("valid"):
-                action_items.append(self.create_action_item(
-                    category=ActionCategory.BANK,
-                    severity=ActionSeverity.BLOCKING,
-                    title="Correct IFSC code",
-                    description=ifsc_result.data.get("error", "Invalid IFSC format"),
-                    suggestion="IFSC should be 11 characters: 4 letters + 0 + 6 alphanumeric.",
-                    field_to_update="bank_details.ifsc",
-                    current_value=ifsc,
-                    required_format="AAAA0BBBBBB",
-                ))
+        # Validate IFSC format - well-formed codes skip the tool call;
+        # anything else goes to the tool for normalization and the error
+        if not ifsc_format_ok(ifsc):
+            ifsc_result = self.call_tool("validate_ifsc", {"ifsc": ifsc})
+            if ifsc_result.success and ifsc_result.data:
+                if not ifsc_result.data.get("valid"):
+                    action_items.append(self.create_action_item(
+                        category=ActionCategory.BANK,
+                        severity=ActionSeverity.BLOCKING,
+                        title="Correct IFSC code",
+                        description=ifsc_result.data.get("error", "Invalid IFSC format"),
+                        suggestion="IFSC should be 11 characters: 4 letters + 0 + 6 alphanumeric.",
+                        field_to_update="bank_details.ifsc",
+                        current_value=ifsc,
+                        required_format="AAAA0BBBBBB",
+                    ))
         
-        # Validate account number format
-        acct_result = self.call_tool("validate_account_number", {"account_number": account_number})
-        if acct_result.success and acct_result.data:
-            if not acct_result.data.get("valid"):
-                action_items.append(self.create_action_item(
-                    category=ActionCategory.BANK,
-                    severity=ActionSeverity.BLOCKING,
-                    title="Correct account number",
-                    description=acct_result.data.get("error", "Invalid account number"),
-                    suggestion="Account number should be 9-18 digits.",
-                    field_to_update="bank_details.account_number",
-                    current_value=account_number,
-                ))
+        # Validate account number format - plain 9-18 digit numbers skip
+        # the tool call; anything else goes to the tool for normalization
+        if not account_number_format_ok(account_number):
+            acct_result = self.call_tool("validate_account_number", {"account_number": account_number})
+            if acct_result.success and acct_result.data:
+                if not acct_result.data.get("valid"):
+                    action_items.append(self.create_action_item(
+                        **_AI_BAD_ACCOUNT,
+                        description=acct_result.data.get("error", "Invalid account number"),
+                        current_value=account_number,
+                    ))
         
         # If format validation failed, return early
         if action_items:
-            return NodeOutput(
-                state_updates={
-                    "is_bank_verified": False,
-                    "error_message": "Bank details validation failed",
-                    "stage": "BANK",
-                },
-                action_items=action_items,
-            )
+            return self._failure("Bank details validation failed", action_items)
         
         # Perform penny drop verification
         penny_result = self.call_tool("penny_drop_verify", {
@@ -225,10 +216,7 @@ class BankVerifierNode(BaseNode):
                 self._add_note(f"Penny drop successful. Bank: {bank_name}, Match: {match_score:.0%}")
                 
                 return NodeOutput(
-                    state_updates={
-                        "is_bank_verified": True,
-                        "stage": "BANK",
-                    },
+                    state_updates=dict(_PASSED_STATE),
                     verification_notes=[
                         "Penny drop successful",
                         f"Bank: {bank_name}",
@@ -245,10 +233,14 @@ class BankVerifierNode(BaseNode):
                     field_to_update="bank_details",
                 ))
         
+        return self._failure("Bank verification failed", action_items)
+    
+    def _failure(self, error_message: str, action_items: List[Dict[str, Any]]) -> NodeOutput:
+        """Failed bank verification with the given error and action items."""
         return NodeOutput(
             state_updates={
                 "is_bank_verified": False,
-                "error_message": "Bank verification failed",
+                "error_message": error_message,
                 "stage": "BANK",
             },
             action_items=action_items,
@@ -15,11 +15,58 @@ TOOLS:
   - (None currently, but can add LLM-based enrichment)
 """
 
+from collections import OrderedDict
 from typing import Any, Dict, List
 from app.core.base_node import BaseNode
 from app.core.contracts import NodeInput, NodeOutput, NodeConfig, LLMConfig
 from app.schema import ActionCategory, ActionSeverity
+import hashlib
 import json
+import threading
+
+
+ENRICHMENT_CACHE_MAX_ENTRIES = 1024
+PLAN_SUGGESTION_MAX_CHARS = 100
+RISK_TABLE_SIZE = 11
+
+# Same (interned) objects create_action_item() stores as severity
+_BLOCKING = ActionSeverity.BLOCKING.value
+_WARNING = ActionSeverity.WARNING.value
+_PERSONALIZED_MARKER = "\n\n**Personalized:** "
+
+# Shared decoder - raw_decode parses the array in place from its first "["
+_JSON_DECODER = json.JSONDecoder()
+
+# Static instructions - merchant data is sent separately as call_llm context
+_ENRICH_PROMPT = """The next message contains the merchant context and their current issues.
+
+For each issue, provide a brief personalized suggestion based on the merchant's business type.
+Return ONLY a JSON array with objects containing:
+- "id": the item ID (if available)
+- "enhanced_suggestion": personalized recommendation (1-2 sentences)
+
+Output ONLY valid JSON."""
+
+
+def _risk_score(blocking: int, warnings: int) -> float:
+    base_score = 0.3
+    score = base_score + (blocking * 0.2) + (warnings * 0.1)
+    return min(1.0, round(score, 2))
+
+
+# Precomputed scores for the counts seen in practice
+_RISK_TABLE = tuple(
+    tuple(_risk_score(b, w) for w in range(RISK_TABLE_SIZE))
+    for b in range(RISK_TABLE_SIZE)
+)
+
+
+def _plan_line(item: Dict[str, Any]) -> str:
+    """One correction plan entry; only long suggestions are sliced."""
+    suggestion = item.get("suggestion", "")
+    if len(suggestion) > PLAN_SUGGESTION_MAX_CHARS:
+        suggestion = suggestion[:PLAN_SUGGESTION_MAX_CHARS]
+    return f"[{item.get('severity', 'INFO')}] {item.get('title', 'Unknown')}: {suggestion}..."
 
 
 class ConsultantNode(BaseNode):
@@ -39,6 +86,11 @@ class ConsultantNode(BaseNode):
     - Risk model integration
     """
     
+    # Enhanced suggestion per (item content, merchant profile), shared by
+    # all instances so retries don't re-enrich unchanged issues
+    _enrichment_cache: "OrderedDict[str, str]" = OrderedDict()
+    _enrichment_lock = threading.Lock()
+    
     @classmethod
     def get_config(cls) -> NodeConfig:
         return NodeConfig(
@@ -66,28 +118,33 @@ Your role is to:
         """
         self._log("Consolidating issues and generating recommendations...")
         
-        # Collect existing action items
-        action_items = list(input.existing_action_items or [])
+        # Collect existing action items - copied, since the input items are
+        # live graph state and LLM enrichment rewrites their suggestions
+        action_items = [dict(item) for item in input.existing_action_items or []]
         
         self._add_note(f"Received {len(action_items)} action items")
         
-        # Count by severity
-        blocking_count = sum(1 for item in action_items if item.get("severity") == "BLOCKING")
-        warning_count = sum(1 for item in action_items if item.get("severity") == "WARNING")
+        # Bucket by severity and count in one pass: BLOCKING first, then
+        # everything else, each by created_at (already near-sorted, so cheap)
+        blocking, rest = [], []
+        warning_count = 0
+        for item in action_items:
+            severity = item.get("severity")
+            if severity == _BLOCKING:
+                blocking.append(item)
+            else:
+                rest.append(item)
+                if severity == _WARNING:
+                    warning_count += 1
         
-        # Sort: BLOCKING first, then WARNING, then by created_at
-        action_items.sort(key=lambda x: (
-            0 if x.get("severity") == "BLOCKING" else 1,
-            x.get("created_at", "")
-        ))
+        by_created = lambda x: x.get("created_at", "")
+        blocking.sort(key=by_created)
+        rest.sort(key=by_created)
+        action_items = blocking + rest
+        blocking_count = len(blocking)
         
         # Generate correction plan summary
-        correction_plan = []
-        for item in action_items:
-            severity = item.get("severity", "INFO")
-            title = item.get("title", "Unknown")
-            suggestion = item.get("suggestion", "")[:100]
-            correction_plan.append(f"[{severity}] {title}: {suggestion}...")
+        correction_plan = [_plan_line(item) for item in action_items]
         
         # Optionally enrich with LLM
         if self.config.llm.enabled and action_items:
@@ -121,9 +178,9 @@ Your role is to:
         """
         Calculate risk score from 0.0 (low risk) to 1.0 (high risk).
         """
-        base_score = 0.3
-        score = base_score + (blocking * 0.2) + (warnings * 0.1)
-        return min(1.0, round(score, 2))
+        if blocking < RISK_TABLE_SIZE and warnings < RISK_TABLE_SIZE:
+            return _RISK_TABLE[blocking][warnings]
+        return _risk_score(blocking, warnings)
     
     def _enrich_with_llm(
         self, 
@@ -142,43 +199,46 @@ Your role is to:
                 "website": business_details.get("website_url", "Not provided"),
             }
             
-            # Build items summary
-            items_summary = "\n".join([
-                f"- {item['title']}: {item['description']}"
-                for item in action_items
-            ])
+            # Reuse earlier enrichments; only new issues go to the LLM.
+            # The prompt summary is built in the same pass.
+            to_enrich = []  # (item, cache_key)
+            items_summary = []
+            for item in action_items:
+                if _PERSONALIZED_MARKER in item.get("suggestion", ""):
+                    continue  # Already enriched
+                key = self._enrichment_key(item, context)
+                enhanced = self._enrichment_get(key)
+                if enhanced:
+                    item["suggestion"] = f"{item['suggestion']}{_PERSONALIZED_MARKER}{enhanced}"
+                else:
+                    to_enrich.append((item, key))
+                    items_summary.append(f"- {item['title']}: {item['description']}")
             
-            prompt = f"""Merchant Context:
-- Business Type: {context['business_type']}
-- Category: {context['category']}
-- Website: {context['website']}
-
-Current Issues:
-{items_summary}
-
-For each issue, provide a brief personalized suggestion based on the merchant's business type.
-Return ONLY a JSON array with objects containing:
-- "id": the item ID (if available)
-- "enhanced_suggestion": personalized recommendation (1-2 sentences)
-
-Output ONLY valid JSON."""
-
-            response = self.call_llm(prompt)
+            if not to_enrich:
+                self._add_note("LLM enrichment served from cache")
+                return action_items
+            
+            response = self.call_llm(
+                _ENRICH_PROMPT,
+                context={
+                    "merchant_context": context,
+                    "current_issues": items_summary,
+                },
+            )
             
             if response:
                 # Parse response and merge
                 try:
                     start = response.find('[')
-                    end = response.rfind(']') + 1
-                    if start != -1 and end > start:
-                        enhancements = json.loads(response[start:end])
+                    if start != -1:
+                        enhancements, _ = _JSON_DECODER.raw_decode(response, start)
                         
                         enhancement_map = {
                             e.get("id", ""): e.get("enhanced_suggestion", "") 
                             for e in enhancements
                         }
                         
-                        for i, item in enumerate(action_items):
+                        for i, (item, key) in enumerate(to_enrich):
                             item_id = item.get("id", "")
                             enhanced = enhancement_map.get(item_id, "")
                             
@@ -186,7 +246,8 @@ Output ONLY valid JSON."""
                                 enhanced = enhancements[i].get("enhanced_suggestion", "")
                             
                             if enhanced:
-                                item["suggestion"] = f"{item['suggestion']}\n\n**Personalized:** {enhanced}"
+                                item["suggestion"] = f"{item['suggestion']}{_PERSONALIZED_MARKER}{enhanced}"
+                                self._enrichment_put(key, enhanced)
                         
                         self._add_note("LLM enrichment applied")
                 except json.JSONDecodeError:
@@ -196,6 +257,33 @@ Output ONLY valid JSON."""
             self._add_note(f"LLM enrichment failed: {e}")
         
         return action_items
+    
+    @staticmethod
+    def _enrichment_key(item: Dict[str, Any], context: Dict[str, Any]) -> str:
+        """Hash of the issue and the merchant profile it was enriched for."""
+        raw = "|".join((
+            item.get("title", ""),
+            item.get("description", ""),
+            str(context["business_type"]),
+            str(context["category"]),
+        ))
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+    
+    @classmethod
+    def _enrichment_get(cls, key: str) -> str:
+        with cls._enrichment_lock:
+            enhanced = cls._enrichment_cache.get(key, "")
+            if enhanced:
+                cls._enrichment_cache.move_to_end(key)
+            return enhanced
+    
+    @classmethod
+    def _enrichment_put(cls, key: str, enhanced: str):
+        with cls._enrichment_lock:
+            cls._enrichment_cache[key] = enhanced
+            cls._enrichment_cache.move_to_end(key)
+            if len(cls._enrichment_cache) > ENRICHMENT_CACHE_MAX_ENTRIES:
+                cls._enrichment_cache.popitem(last=False)
 
 
 # Create callable for LangGraph
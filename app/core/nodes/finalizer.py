@@ -17,6 +17,14 @@ from app.core.base_node import BaseNode
 from app.core.contracts import NodeInput, NodeOutput, NodeConfig, LLMConfig
 
 
+# (display name, NodeInput flag) for the failed-checks warning
+_CHECKS = (
+    ("Auth/Input", "is_auth_valid"),
+    ("Documents", "is_doc_verified"),
+    ("Bank", "is_bank_verified"),
+    ("Website", "is_website_compliant"),
+)
+
 class FinalizerNode(BaseNode):
     """
     Final node that marks onboarding as complete.
@@ -50,18 +58,16 @@ class FinalizerNode(BaseNode):
         """
         self._log("Finalizing onboarding...")
         
-        # Verify all checks passed
-        checks = {
-            "Auth/Input": input.is_auth_valid,
-            "Documents": input.is_doc_verified,
-            "Bank": input.is_bank_verified,
-            "Website": input.is_website_compliant,
-        }
-        
-        all_passed = all(checks.values())
+        # Verify all checks passed - names are only looked up on failure
+        all_passed = (
+            input.is_auth_valid
+            and input.is_doc_verified
+            and input.is_bank_verified
+            and input.is_website_compliant
+        )
         
         if not all_passed:
-            failed_checks = [name for name, passed in checks.items() if not passed]
+            failed_checks = [name for name, flag in _CHECKS if not getattr(input, flag)]
             self._add_note(f"Warning: Some checks not passed: {failed_checks}")
         
         notes = [
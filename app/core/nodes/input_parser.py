@@ -18,7 +18,18 @@ TOOLS:
 from typing import Any, Dict
 from app.core.base_node import BaseNode
 from app.core.contracts import NodeInput, NodeOutput, NodeConfig, LLMConfig
+from app.core.tools.validation import PAN_HOLDER_TYPES, gstin_format_ok, pan_format_ok
 from app.schema import ActionCategory, ActionSeverity
+from types import MappingProxyType
+
+
+# Passing state shared by every success branch - copied per call so runs
+# never share a dict
+_PASSED_STATE = MappingProxyType({
+    "is_auth_valid": True,
+    "stage": "INPUT",
+})
+_SKIPPED_NOTE = "Input validation passed (simulated)"
 
 
 class InputParserNode(BaseNode):
@@ -43,7 +54,9 @@ class InputParserNode(BaseNode):
             description="Validates initial application data (PAN, GSTIN formats)",
             stage="INPUT",
             available_tools=["validate_pan", "validate_gstin"],
+            expected_tool_calls=2,
             simulation_key="input",
+            starts_pass=True,
             llm=LLMConfig(
                 enabled=False,  # Can enable for entity type validation
                 system_prompt="You are validating merchant business information."
@@ -66,12 +79,8 @@ class InputParserNode(BaseNode):
         if self.should_skip_checks():
             self._add_note("SIMULATION: Input validation skipped (force_success)")
             return NodeOutput(
-                state_updates={
-                    "is_auth_valid": True,
-                    "stage": "INPUT",
-                },
-                action_items=[],
-                verification_notes=["Input validation passed (simulated)"],
+                state_updates=dict(_PASSED_STATE),
+                verification_notes=[_SKIPPED_NOTE],
                 next_node="doc_intelligence_node",
             )
         
@@ -122,8 +131,11 @@ class InputParserNode(BaseNode):
         
         # --- Real Validation using Tools ---
         
-        # Validate PAN
-        if pan:
+        # Validate PAN - well-formed values skip the tool call; anything
+        # else goes to the tool for normalization and the error
+        if pan and pan_format_ok(pan):
+            self._add_note(f"PAN valid: {PAN_HOLDER_TYPES.get(pan[3], 'Unknown')}")
+        elif pan:
             pan_result = self.call_tool("validate_pan", {"pan": pan})
             if pan_result.success and pan_result.data:
                 if pan_result.data.get("valid"):
@@ -140,8 +152,10 @@ class InputParserNode(BaseNode):
                         required_format="AAAAA9999A",
                     ))
         
-        # Validate GSTIN
-        if gstin:
+        # Validate GSTIN (same fast path)
+        if gstin and gstin_format_ok(gstin):
+            self._add_note(f"GSTIN valid: state {gstin[:2]}")
+        elif gstin:
             gstin_result = self.call_tool("validate_gstin", {"gstin": gstin})
             if gstin_result.success and gstin_result.data:
                 if gstin_result.data.get("valid"):
@@ -175,10 +189,7 @@ class InputParserNode(BaseNode):
         self._add_note(f"Processing {entity_type} merchant")
         
         return NodeOutput(
-            state_updates={
-                "is_auth_valid": True,
-                "stage": "INPUT",
-            },
+            state_updates=dict(_PASSED_STATE),
             action_items=[],
             verification_notes=["Basic data validation passed"],
             next_node="doc_intelligence_node",
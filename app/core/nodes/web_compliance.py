@@ -11,15 +11,162 @@ OUTPUT:
 
 TOOLS:
   - check_ssl
-  - fetch_webpage_sync
+  - fetch_webpage (async path) / fetch_webpage_sync
   - check_page_policies
   - take_screenshot
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 from app.core.base_node import BaseNode
-from app.core.contracts import NodeInput, NodeOutput, NodeConfig, LLMConfig
+from app.core.contracts import NodeInput, NodeOutput, NodeConfig, LLMConfig, ToolResult
 from app.schema import ActionCategory, ActionSeverity
+from collections import OrderedDict
+from dataclasses import replace
+from types import MappingProxyType
+import asyncio
+import threading
+import time
+
+
+FETCH_TIMEOUT_S = 30
+WEB_CACHE_MAX_ENTRIES = 1024
+WEB_CACHE_TTL_S = 3600
+SSL_EXPIRY_WARNING_DAYS = 30
+
+# Policy scan flags that must all be set for a page to be compliant
+_POLICY_FLAGS = ("has_privacy_policy", "has_terms", "has_refund_policy", "has_contact_info")
+
+
+# Passing state shared by every success branch - copied per call so runs
+# never share a dict
+_PASSED_STATE = MappingProxyType({
+    "is_website_compliant": True,
+    "stage": "COMPLIANCE",
+})
+_SKIPPED_NOTE = "Website compliance passed (simulated)"
+
+
+# Static action item templates - splat into create_action_item().
+# SSL descriptions come from _SSL_FAILURES.
+_AI_NO_SSL = MappingProxyType({
+    "category": ActionCategory.WEBSITE,
+    "severity": ActionSeverity.BLOCKING,
+    "title": "Enable HTTPS/SSL on your website",
+    "suggestion": "Install an SSL certificate. Most hosting providers offer free SSL via Let's Encrypt.",
+    "field_to_update": "business_details.website_url",
+})
+
+_AI_INVALID_SSL = MappingProxyType({
+    "category": ActionCategory.WEBSITE,
+    "severity": ActionSeverity.BLOCKING,
+    "title": "Fix SSL certificate",
+    "suggestion": "Contact your hosting provider to renew or fix your SSL certificate.",
+})
+
+_AI_SSL_EXPIRING = MappingProxyType({
+    "category": ActionCategory.WEBSITE,
+    "severity": ActionSeverity.WARNING,
+    "title": "Renew SSL certificate soon",
+    "suggestion": "Renew your SSL certificate to avoid disruption.",
+})
+
+_AI_UNREACHABLE = MappingProxyType({
+    "category": ActionCategory.WEBSITE,
+    "severity": ActionSeverity.WARNING,
+    "title": "Ensure website is accessible",
+    "suggestion": "Make sure your website is online and publicly accessible.",
+    "field_to_update": "business_details.website_url",
+})
+
+_AI_PRIVACY = MappingProxyType({
+    "category": ActionCategory.COMPLIANCE,
+    "severity": ActionSeverity.BLOCKING,
+    "title": "Add Privacy Policy page",
+    "description": "A Privacy Policy is legally required for collecting customer data.",
+    "suggestion": "Create a Privacy Policy page and link it in your website footer.",
+    "sample_content": "Your Privacy Policy should explain what data you collect, how you use it, and how customers can request deletion.",
+})
+
+_AI_TERMS = MappingProxyType({
+    "category": ActionCategory.COMPLIANCE,
+    "severity": ActionSeverity.BLOCKING,
+    "title": "Add Terms of Service page",
+    "description": "Terms of Service define the rules for using your website and services.",
+    "suggestion": "Create a Terms of Service page and link it in your website footer.",
+    "sample_content": "Your Terms should cover user responsibilities, payment terms, and dispute resolution.",
+})
+
+_AI_REFUND = MappingProxyType({
+    "category": ActionCategory.COMPLIANCE,
+    "severity": ActionSeverity.BLOCKING,
+    "title": "Add Refund/Return Policy page",
+    "description": "A clear refund policy is required for accepting online payments.",
+    "suggestion": "Create a Refund Policy page explaining your return and refund process.",
+    "sample_content": "Your policy should explain how to request refunds, timeline, and any conditions.",
+})
+
+_AI_CONTACT = MappingProxyType({
+    "category": ActionCategory.COMPLIANCE,
+    "severity": ActionSeverity.BLOCKING,
+    "title": "Add contact information to website",
+    "description": "Contact information is required for customer support.",
+    "suggestion": "Add a visible contact section with email and/or phone number.",
+})
+
+# SSL status -> (compliance issue, action item description, template).
+# Issue and description are formatted with the certificate's expiry days.
+_SSL_FAILURES = {
+    "no_ssl": (
+        "Website is not using HTTPS (Insecure)",
+        "Your website is not using HTTPS, which is required for secure payment processing.",
+        _AI_NO_SSL,
+    ),
+    "invalid": (
+        "SSL certificate is invalid or expired",
+        "Your SSL certificate is invalid or expired.",
+        _AI_INVALID_SSL,
+    ),
+    "expiring": (
+        "SSL certificate expires in {days} days",
+        "Your SSL certificate expires in {days} days.",
+        _AI_SSL_EXPIRING,
+    ),
+}
+
+
+def _normalize_url(website_url: str) -> str:
+    # API input is already canonical (schema.normalize_website_url); this
+    # only covers states built without the request models
+    if not website_url.startswith(('http://', 'https://')):
+        return f"https://{website_url}"
+    return website_url
+
+
+def _ssl_status(ssl: Dict[str, Any]) -> Optional[str]:
+    """_SSL_FAILURES key for a check_ssl result, or None if it passed."""
+    if not ssl.get("has_ssl"):
+        return "no_ssl"
+    if not ssl.get("certificate_valid"):
+        return "invalid"
+    expiry_days = ssl.get("expiry_days")
+    if expiry_days and expiry_days < SSL_EXPIRY_WARNING_DAYS:
+        return "expiring"
+    return None
+
+# Simulated failure -> (note label, compliance issue, action item builder).
+# Keys match the web_* scenarios in SimulationConfig; checked in this order.
+_SIMULATED_FAILURES = (
+    ("no_ssl", "No SSL", "Website is not using HTTPS (Insecure)",
+     lambda node, url: node._create_ssl_action_item(url)),
+    ("no_privacy_policy", "No privacy policy", "Missing Privacy Policy page",
+     lambda node, url: node._create_privacy_action_item()),
+    ("no_terms", "No terms", "Missing Terms of Service page",
+     lambda node, url: node._create_terms_action_item()),
+    ("no_refund_policy", "No refund policy", "Missing Refund/Return Policy page",
+     lambda node, url: node._create_refund_action_item()),
+    ("no_contact", "No contact info", "No contact information found",
+     lambda node, url: node._create_contact_action_item()),
+)
 
 
 class WebComplianceNode(BaseNode):
@@ -39,6 +186,11 @@ class WebComplianceNode(BaseNode):
     - Adverse media check
     """
     
+    # (ssl, fetch, policy) results per normalized URL, shared by all
+    # instances so resubmissions after unrelated fixes skip the network
+    _web_cache: "OrderedDict[str, Tuple[float, Tuple[ToolResult, ...]]]" = OrderedDict()
+    _web_cache_lock = threading.Lock()
+    
     @classmethod
     def get_config(cls) -> NodeConfig:
         return NodeConfig(
@@ -48,10 +200,12 @@ class WebComplianceNode(BaseNode):
             stage="COMPLIANCE",
             available_tools=[
                 "check_ssl",
+                "fetch_webpage",
                 "fetch_webpage_sync",
                 "check_page_policies",
                 "take_screenshot",
             ],
+            expected_tool_calls=3,
             simulation_key="web",
             llm=LLMConfig(
                 enabled=False,  # Can enable for content quality analysis
@@ -61,12 +215,61 @@ class WebComplianceNode(BaseNode):
     
     def process(self, input: NodeInput) -> NodeOutput:
         """
-        Check website compliance.
+        Check website compliance (sync path - one tool call at a time).
         """
-        self._log("Checking website compliance...")
+        website_url = input.application_data.get("business_details", {}).get("website_url", "")
+        early = self._early_output(website_url)
+        if early:
+            return early
+        
+        website_url = _normalize_url(website_url)
+        cached = self._web_cache_get(website_url)
+        if cached:
+            return self._build_output(website_url, *cached)
+        
+        ssl_result = self.call_tool("check_ssl", {"url": website_url})
+        fetch_result = self.call_tool("fetch_webpage_sync", {
+            "url": website_url,
+            "timeout": FETCH_TIMEOUT_S,
+        })
+        policy_result = self._check_policies(fetch_result, website_url)
+        self._web_cache_put(website_url, ssl_result, fetch_result, policy_result)
         
-        business_details = input.application_data.get("business_details", {})
-        website_url = business_details.get("website_url", "")
+        return self._build_output(website_url, ssl_result, fetch_result, policy_result)
+    
+    async def aprocess(self, input: NodeInput) -> NodeOutput:
+        """
+        Check website compliance with the SSL check and page fetch overlapped.
+        
+        Both are independent network round trips, so the node waits for the
+        slower of the two instead of their sum. The blocking socket-level SSL
+        check runs in a worker thread; the fetch uses the async HTTP client.
+        """
+        website_url = input.application_data.get("business_details", {}).get("website_url", "")
+        early = self._early_output(website_url)
+        if early:
+            return early
+        
+        website_url = _normalize_url(website_url)
+        cached = self._web_cache_get(website_url)
+        if cached:
+            return self._build_output(website_url, *cached)
+        
+        ssl_result, fetch_result = await asyncio.gather(
+            asyncio.to_thread(self.call_tool, "check_ssl", {"url": website_url}),
+            self.call_tool_async("fetch_webpage", {
+                "url": website_url,
+                "timeout": FETCH_TIMEOUT_S,
+            }),
+        )
+        policy_result = await asyncio.to_thread(self._check_policies, fetch_result, website_url)
+        self._web_cache_put(website_url, ssl_result, fetch_result, policy_result)
+        
+        return self._build_output(website_url, ssl_result, fetch_result, policy_result)
+    
+    def _early_output(self, website_url: str) -> Optional[NodeOutput]:
+        """Output for force success, simulated failures or no website, if any."""
+        self._log("Checking website compliance...")
         
         action_items = []
         compliance_issues = []
@@ -75,40 +278,16 @@ class WebComplianceNode(BaseNode):
         if self.should_skip_checks():
             self._add_note("SIMULATION: Web compliance checks skipped (force_success)")
             return NodeOutput(
-                state_updates={
-                    "is_website_compliant": True,
-                    "compliance_issues": [],
-                    "stage": "COMPLIANCE",
-                },
-                action_items=[],
-                verification_notes=["Website compliance passed (simulated)"],
+                state_updates={**_PASSED_STATE, "compliance_issues": []},
+                verification_notes=[_SKIPPED_NOTE],
             )
         
         # --- Simulate Failures ---
-        if self.should_simulate_failure("no_ssl"):
-            self._add_note("SIMULATION: No SSL failure triggered")
-            compliance_issues.append("Website is not using HTTPS (Insecure)")
-            action_items.append(self._create_ssl_action_item(website_url))
-        
-        if self.should_simulate_failure("no_privacy"):
-            self._add_note("SIMULATION: No privacy policy failure triggered")
-            compliance_issues.append("Missing Privacy Policy page")
-            action_items.append(self._create_privacy_action_item())
-        
-        if self.should_simulate_failure("no_terms"):
-            self._add_note("SIMULATION: No terms failure triggered")
-            compliance_issues.append("Missing Terms of Service page")
-            action_items.append(self._create_terms_action_item())
-        
-        if self.should_simulate_failure("no_refund"):
-            self._add_note("SIMULATION: No refund policy failure triggered")
-            compliance_issues.append("Missing Refund/Return Policy page")
-            action_items.append(self._create_refund_action_item())
-        
-        if self.should_simulate_failure("no_contact"):
-            self._add_note("SIMULATION: No contact info failure triggered")
-            compliance_issues.append("No contact information found")
-            action_items.append(self._create_contact_action_item())
+        for scenario, label, issue, build in _SIMULATED_FAILURES:
+            if self.should_simulate_failure(scenario):
+                self._add_note(f"SIMULATION: {label} failure triggered")
+                compliance_issues.append(issue)
+                action_items.append(build(self, website_url))
         
         # Return early if simulated failures
         if action_items:
@@ -128,62 +307,51 @@ class WebComplianceNode(BaseNode):
         if not website_url:
             self._add_note("No website URL provided, skipping compliance checks")
             return NodeOutput(
-                state_updates={
-                    "is_website_compliant": True,  # Pass for merchants without websites
-                    "stage": "COMPLIANCE",
-                },
+                state_updates=dict(_PASSED_STATE),  # Pass for merchants without websites
                 verification_notes=["No website provided, skipping checks"],
             )
         
-        # Normalize URL
-        if not website_url.startswith(('http://', 'https://')):
-            website_url = f"https://{website_url}"
+        return None
+    
+    def _check_policies(self, fetch_result: ToolResult, website_url: str) -> Optional[ToolResult]:
+        """Scan the fetched page for required policies (None if the fetch failed)."""
+        if not (fetch_result.success and fetch_result.data):
+            return None
+        return self.call_tool("check_page_policies", {
+            "html": fetch_result.data.get("html", ""),
+            "base_url": website_url,
+        })
+    
+    def _build_output(
+        self,
+        website_url: str,
+        ssl_result: ToolResult,
+        fetch_result: ToolResult,
+        policy_result: Optional[ToolResult],
+    ) -> NodeOutput:
+        """Turn the SSL, fetch and policy results into issues and action items."""
+        action_items = []
+        compliance_issues = []
         
         # Check SSL
-        ssl_result = self.call_tool("check_ssl", {"url": website_url})
         if ssl_result.success and ssl_result.data:
-            if not ssl_result.data.get("has_ssl"):
-                compliance_issues.append("Website is not using HTTPS (Insecure)")
-                action_items.append(self._create_ssl_action_item(website_url))
-            elif not ssl_result.data.get("certificate_valid"):
-                compliance_issues.append("SSL certificate is invalid or expired")
+            expiry_days = ssl_result.data.get("expiry_days")
+            status = _ssl_status(ssl_result.data)
+            if status:
+                issue, description, template = _SSL_FAILURES[status]
+                compliance_issues.append(issue.format(days=expiry_days))
                 action_items.append(self.create_action_item(
-                    category=ActionCategory.WEBSITE,
-                    severity=ActionSeverity.BLOCKING,
-                    title="Fix SSL certificate",
-                    description="Your SSL certificate is invalid or expired.",
-                    suggestion="Contact your hosting provider to renew or fix your SSL certificate.",
+                    **template,
+                    description=description.format(days=expiry_days),
+                    # Only the no-SSL item points at a field to update
+                    current_value=website_url if "field_to_update" in template else None,
                 ))
             else:
-                expiry_days = ssl_result.data.get("expiry_days")
-                if expiry_days and expiry_days < 30:
-                    compliance_issues.append(f"SSL certificate expires in {expiry_days} days")
-                    action_items.append(self.create_action_item(
-                        category=ActionCategory.WEBSITE,
-                        severity=ActionSeverity.WARNING,
-                        title="Renew SSL certificate soon",
-                        description=f"Your SSL certificate expires in {expiry_days} days.",
-                        suggestion="Renew your SSL certificate to avoid disruption.",
-                    ))
-                else:
-                    self._add_note(f"SSL valid, expires in {expiry_days} days")
-        
-        # Fetch webpage and check policies
-        fetch_result = self.call_tool("fetch_webpage_sync", {
-            "url": website_url,
-            "timeout": 30,
-        })
+                self._add_note(f"SSL valid, expires in {expiry_days} days")
         
+        # Check for required policies
         if fetch_result.success and fetch_result.data:
-            html = fetch_result.data.get("html", "")
-            
-            # Check for required policies
-            policy_result = self.call_tool("check_page_policies", {
-                "html": html,
-                "base_url": website_url,
-            })
-            
-            if policy_result.success and policy_result.data:
+            if policy_result and policy_result.success and policy_result.data:
                 policies = policy_result.data
                 
                 if not policies.get("has_privacy_policy"):
@@ -212,12 +380,8 @@ class WebComplianceNode(BaseNode):
         else:
             compliance_issues.append(f"Could not fetch website: {fetch_result.error}")
             action_items.append(self.create_action_item(
-                category=ActionCategory.WEBSITE,
-                severity=ActionSeverity.WARNING,
-                title="Ensure website is accessible",
+                **_AI_UNREACHABLE,
                 description=f"Could not access your website: {fetch_result.error}",
-                suggestion="Make sure your website is online and publicly accessible.",
-                field_to_update="business_details.website_url",
                 current_value=website_url,
             ))
         
@@ -225,13 +389,17 @@ class WebComplianceNode(BaseNode):
         blocking_count = sum(1 for item in action_items if item.get("severity") == "BLOCKING")
         is_compliant = blocking_count == 0
         
+        state_updates = {
+            "is_website_compliant": is_compliant,
+            "compliance_issues": compliance_issues,
+            "stage": "COMPLIANCE",
+        }
+        # Only report errors - sibling verifiers may be writing theirs in parallel
+        if not is_compliant:
+            state_updates["error_message"] = "Website compliance checks failed"
+        
         return NodeOutput(
-            state_updates={
-                "is_website_compliant": is_compliant,
-                "compliance_issues": compliance_issues,
-                "stage": "COMPLIANCE",
-                "error_message": "Website compliance checks failed" if not is_compliant else None,
-            },
+            state_updates=state_updates,
             action_items=action_items,
             verification_notes=[
                 f"Website: {website_url}",
@@ -240,57 +408,67 @@ class WebComplianceNode(BaseNode):
             ],
         )
     
+    def _web_cache_get(self, url: str) -> Optional[Tuple[ToolResult, ...]]:
+        """Cached (ssl, fetch, policy) results for url, if still fresh."""
+        cls = type(self)
+        with cls._web_cache_lock:
+            entry = cls._web_cache.get(url)
+            if entry is None:
+                return None
+            stored_at, results = entry
+            if time.monotonic() - stored_at > WEB_CACHE_TTL_S:
+                del cls._web_cache[url]
+                return None
+            cls._web_cache.move_to_end(url)
+        self._add_note("Website checks served from cache")
+        return results
+    
+    @classmethod
+    def _web_cache_put(
+        cls,
+        url: str,
+        ssl_result: ToolResult,
+        fetch_result: ToolResult,
+        policy_result: Optional[ToolResult],
+    ):
+        # Only fully compliant results - failures may be transient and the
+        # merchant may fix a flagged issue (SSL, missing policy) at any time
+        if not (
+            ssl_result.success and ssl_result.data
+            and _ssl_status(ssl_result.data) is None
+            and fetch_result.success and fetch_result.data
+            and policy_result and policy_result.success and policy_result.data
+            and all(policy_result.data.get(flag) for flag in _POLICY_FLAGS)
+        ):
+            return
+        # The policy scan already consumed the page; don't hold on to it
+        fetch_result = replace(fetch_result, data={**fetch_result.data, "html": ""})
+        with cls._web_cache_lock:
+            cls._web_cache[url] = (time.monotonic(), (ssl_result, fetch_result, policy_result))
+            cls._web_cache.move_to_end(url)
+            if len(cls._web_cache) > WEB_CACHE_MAX_ENTRIES:
+                cls._web_cache.popitem(last=False)
+    
     # --- Action Item Helpers ---
     
     def _create_ssl_action_item(self, url: str):
         return self.create_action_item(
-            category=ActionCategory.WEBSITE,
-            severity=ActionSeverity.BLOCKING,
-            title="Enable HTTPS/SSL on your website",
-            description="Your website is not using HTTPS, which is required for secure payment processing.",
-            suggestion="Install an SSL certificate. Most hosting providers offer free SSL via Let's Encrypt.",
-            field_to_update="business_details.website_url",
+            **_AI_NO_SSL,
+            description=_SSL_FAILURES["no_ssl"][1],
             current_value=url,
         )
     
     def _create_privacy_action_item(self):
-        return self.create_action_item(
-            category=ActionCategory.COMPLIANCE,
-            severity=ActionSeverity.BLOCKING,
-            title="Add Privacy Policy page",
-            description="A Privacy Policy is legally required for collecting customer data.",
-            suggestion="Create a Privacy Policy page and link it in your website footer.",
-            sample_content="Your Privacy Policy should explain what data you collect, how you use it, and how customers can request deletion.",
-        )
+        return self.create_action_item(**_AI_PRIVACY)
     
     def _create_terms_action_item(self):
-        return self.create_action_item(
-            category=ActionCategory.COMPLIANCE,
-            severity=ActionSeverity.BLOCKING,
-            title="Add Terms of Service page",
-            description="Terms of Service define the rules for using your website and services.",
-            suggestion="Create a Terms of Service page and link it in your website footer.",
-            sample_content="Your Terms should cover user responsibilities, payment terms, and dispute resolution.",
-        )
+        return self.create_action_item(**_AI_TERMS)
     
     def _create_refund_action_item(self):
-        return self.create_action_item(
-            category=ActionCategory.COMPLIANCE,
-            severity=ActionSeverity.BLOCKING,
-            title="Add Refund/Return Policy page",
-            description="A clear refund policy is required for accepting online payments.",
-            suggestion="Create a Refund Policy page explaining your return and refund process.",
-            sample_content="Your policy should explain how to request refunds, timeline, and any conditions.",
-        )
+        return self.create_action_item(**_AI_REFUND)
     
     def _create_contact_action_item(self):
-        return self.create_action_item(
-            category=ActionCategory.COMPLIANCE,
-            severity=ActionSeverity.BLOCKING,
-            title="Add contact information to website",
-            description="Contact information is required for customer support.",
-            suggestion="Add a visible contact section with email and/or phone number.",
-        )
+        return self.create_action_item(**_AI_CONTACT)
 
 
 # Create callable for LangGraph
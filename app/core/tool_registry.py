@@ -13,14 +13,50 @@ This registry pattern allows:
 4. Runtime tool discovery
 """
 
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Callable, Dict, List, Optional, Awaitable, Union
 from app.core.contracts import ToolDefinition, ToolResult
+import atexit
+import importlib.util
+import threading
 import time
 
+import httpx
+
 
 # Type for tool implementations
 ToolImplementation = Callable[..., Union[Dict[str, Any], Awaitable[Dict[str, Any]]]]
 
+# Shared HTTP pool settings (keep-alive lets tools reuse TCP/TLS sessions)
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# Dispatch failures that don't depend on the call's inputs
+_TOOL_NOT_FOUND = "Tool '{name}' not found in registry"
+_NO_IMPLEMENTATION = "No implementation for '{name}'"
+_NO_MOCK_IMPLEMENTATION = "No mock implementation for '{name}'"
+
+
+@lru_cache(maxsize=256)
+def _dispatch_error(name: str, error: str) -> ToolResult:
+    """Shared failure result for a tool that can't be dispatched."""
+    return ToolResult(
+        tool_name=name,
+        success=False,
+        error=error.format(name=name),
+    )
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only deep view of a mock payload (dicts -> mappingproxy, lists -> tuple)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
 
 class ToolRegistry:
     """
@@ -46,7 +82,63 @@ class ToolRegistry:
         self._tools: Dict[str, ToolDefinition] = {}
         self._implementations: Dict[str, ToolImplementation] = {}
         self._mock_implementations: Dict[str, ToolImplementation] = {}
+        self._mock_results: Dict[str, ToolResult] = {}  # Prebuilt static mock_output results
         self._use_mocks: bool = False
+        self._openai_functions: Optional[List[Dict[str, Any]]] = None  # Built on first export
+        self._by_category: Optional[Dict[str, List[ToolDefinition]]] = None  # Built on first lookup
+        self._http: Optional[httpx.AsyncClient] = None
+        self._http_sync: Optional[httpx.Client] = None
+        self._http_lock = threading.Lock()
+    
+    # =========================================================================
+    # Shared HTTP Clients
+    # =========================================================================
+    
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """
+        Pooled async HTTP client shared by all tools.
+        
+        Created on first use. Tools should use this instead of opening
+        their own client so connections are kept alive across calls.
+        """
+        if self._http is None or self._http.is_closed:
+            with self._http_lock:
+                if self._http is None or self._http.is_closed:
+                    self._http = httpx.AsyncClient(
+                        limits=HTTP_LIMITS,
+                        timeout=HTTP_TIMEOUT,
+                        http2=HTTP2_ENABLED,
+                        follow_redirects=True,
+                    )
+        return self._http
+    
+    @property
+    def http_sync(self) -> httpx.Client:
+        """Pooled sync HTTP client for tools that can't await."""
+        if self._http_sync is None or self._http_sync.is_closed:
+            with self._http_lock:
+                if self._http_sync is None or self._http_sync.is_closed:
+                    self._http_sync = httpx.Client(
+                        limits=HTTP_LIMITS,
+                        timeout=HTTP_TIMEOUT,
+                        http2=HTTP2_ENABLED,
+                        follow_redirects=True,
+                    )
+        return self._http_sync
+    
+    def close_http(self):
+        """Close the sync HTTP client (registered with atexit)."""
+        if self._http_sync is not None:
+            self._http_sync.close()
+            self._http_sync = None
+    
+    async def aclose_http(self):
+        """Close both HTTP clients (call from the app shutdown hook)."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        self.close_http()
     
     def register(
         self,
@@ -87,6 +179,18 @@ class ToolRegistry:
             )
             self._tools[name] = definition
             self._implementations[name] = func
+            if definition.mock_output:
+                self._mock_results[name] = ToolResult(
+                    tool_name=name,
+                    success=True,
+                    data=_freeze(definition.mock_output),
+                    execution_time_ms=0,
+                    was_mocked=True,
+                )
+            else:
+                self._mock_results.pop(name, None)
+            self._openai_functions = None
+            self._by_category = None
             return func
         return decorator
     
@@ -117,8 +221,18 @@ class ToolRegistry:
         return list(self._tools.values())
     
     def get_tools_by_category(self, category: str) -> List[ToolDefinition]:
-        """Get all tools in a category."""
-        return [t for t in self._tools.values() if t.category == category]
+        """
+        Get all tools in a category.
+        
+        Served from a category index built on first use and rebuilt only
+        after a new tool is registered. Returns a fresh list.
+        """
+        if self._by_category is None:
+            by_category: Dict[str, List[ToolDefinition]] = {}
+            for tool in self._tools.values():
+                by_category.setdefault(tool.category, []).append(tool)
+            self._by_category = by_category
+        return list(self._by_category.get(category, ()))
     
     def call(
         self,
@@ -137,44 +251,34 @@ class ToolRegistry:
         Returns:
             ToolResult with success/failure and data
         """
-        if name not in self._tools:
-            return ToolResult(
-                tool_name=name,
-                success=False,
-                error=f"Tool '{name}' not found in registry"
-            )
+        # One probe per table - .get() instead of "in" followed by [name]
+        tool = self._tools.get(name)
+        if tool is None:
+            return _dispatch_error(name, _TOOL_NOT_FOUND)
         
         # Determine if we should use mock
         should_mock = use_mock if use_mock is not None else self._use_mocks
         
-        start_time = time.time()
+        # Static mock_output: nothing runs, so there is nothing to time
+        if should_mock and name not in self._mock_implementations:
+            return self._mock_results.get(name) or _dispatch_error(name, _NO_MOCK_IMPLEMENTATION)
+        
+        start_ns = time.perf_counter_ns()
         
         try:
             if should_mock:
-                # Use mock implementation or static mock output
-                if name in self._mock_implementations:
-                    data = self._mock_implementations[name](**inputs)
-                elif self._tools[name].mock_output:
-                    data = self._tools[name].mock_output
-                else:
-                    return ToolResult(
-                        tool_name=name,
-                        success=False,
-                        error=f"No mock implementation for '{name}'"
-                    )
+                # Registered mock implementation (static output returned above)
+                data = self._mock_implementations[name](**inputs)
                 was_mocked = True
             else:
                 # Use real implementation
-                if name not in self._implementations:
-                    return ToolResult(
-                        tool_name=name,
-                        success=False,
-                        error=f"No implementation for '{name}'"
-                    )
-                data = self._implementations[name](**inputs)
+                impl = self._implementations.get(name)
+                if impl is None:
+                    return _dispatch_error(name, _NO_IMPLEMENTATION)
+                data = impl(**inputs)
                 was_mocked = False
             
-            execution_time = int((time.time() - start_time) * 1000)
+            execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             return ToolResult(
                 tool_name=name,
@@ -185,7 +289,7 @@ class ToolRegistry:
             )
             
         except Exception as e:
-            execution_time = int((time.time() - start_time) * 1000)
+            execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
             return ToolResult(
                 tool_name=name,
                 success=False,
@@ -203,49 +307,40 @@ class ToolRegistry:
         """
         Call an async tool by name.
         """
-        if name not in self._tools:
-            return ToolResult(
-                tool_name=name,
-                success=False,
-                error=f"Tool '{name}' not found in registry"
-            )
+        # One probe per table - .get() instead of "in" followed by [name]
+        tool = self._tools.get(name)
+        if tool is None:
+            return _dispatch_error(name, _TOOL_NOT_FOUND)
         
         should_mock = use_mock if use_mock is not None else self._use_mocks
-        start_time = time.time()
+        
+        # Static mock_output: nothing runs, so there is nothing to time
+        if should_mock and name not in self._mock_implementations:
+            return self._mock_results.get(name) or _dispatch_error(name, _NO_MOCK_IMPLEMENTATION)
+        
+        start_ns = time.perf_counter_ns()
         
         try:
             if should_mock:
-                if name in self._mock_implementations:
-                    result = self._mock_implementations[name](**inputs)
-                    # Handle both sync and async mocks
-                    if hasattr(result, '__await__'):
-                        data = await result
-                    else:
-                        data = result
-                elif self._tools[name].mock_output:
-                    data = self._tools[name].mock_output
+                result = self._mock_implementations[name](**inputs)
+                # Handle both sync and async mocks
+                if hasattr(result, '__await__'):
+                    data = await result
                 else:
-                    return ToolResult(
-                        tool_name=name,
-                        success=False,
-                        error=f"No mock implementation for '{name}'"
-                    )
+                    data = result
                 was_mocked = True
             else:
-                if name not in self._implementations:
-                    return ToolResult(
-                        tool_name=name,
-                        success=False,
-                        error=f"No implementation for '{name}'"
-                    )
-                result = self._implementations[name](**inputs)
+                impl = self._implementations.get(name)
+                if impl is None:
+                    return _dispatch_error(name, _NO_IMPLEMENTATION)
+                result = impl(**inputs)
                 if hasattr(result, '__await__'):
                     data = await result
                 else:
                     data = result
                 was_mocked = False
             
-            execution_time = int((time.time() - start_time) * 1000)
+            execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             return ToolResult(
                 tool_name=name,
@@ -256,7 +351,7 @@ class ToolRegistry:
             )
             
         except Exception as e:
-            execution_time = int((time.time() - start_time) * 1000)
+            execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
             return ToolResult(
                 tool_name=name,
                 success=False,
@@ -269,20 +364,28 @@ class ToolRegistry:
         """
         Export tools as OpenAI function definitions.
         
-        Useful for LLM function calling.
+        Useful for LLM function calling. Built once and rebuilt only after a
+        new tool is registered - the returned list is shared, so treat it
+        as read-only.
         """
-        functions = []
-        for tool in self._tools.values():
-            functions.append({
-                "name": tool.name,
-                "description": tool.description,
-                "parameters": {
-                    "type": "object",
-                    "properties": tool.input_schema,
-                    "required": list(tool.input_schema.keys()),
+        if self._openai_functions is None:
+            self._openai_functions = [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "parameters": {
+                        "type": "object",
+                        "properties": tool.input_schema,
+                        # Inputs with a default are optional
+                        "required": [
+                            name for name, spec in tool.input_schema.items()
+                            if "default" not in spec
+                        ],
+                    }
                 }
-            })
-        return functions
+                for tool in self._tools.values()
+            ]
+        return self._openai_functions
     
     def __contains__(self, name: str) -> bool:
         return name in self._tools
@@ -293,4 +396,5 @@ class ToolRegistry:
 
 # Global registry instance
 tool_registry = ToolRegistry()
+atexit.register(tool_registry.close_http)
 
@@ -2,10 +2,45 @@
 Bank Tools - Penny drop, account verification, IFSC lookup.
 """
 
+from types import MappingProxyType
 from typing import Any, Dict
 from app.core.tool_registry import tool_registry
 
 
+# IFSC bank code (first 4 chars) -> bank name
+_BANK_NAMES = MappingProxyType({
+    "HDFC": "HDFC Bank",
+    "ICIC": "ICICI Bank",
+    "SBIN": "State Bank of India",
+    "AXIS": "Axis Bank",
+    "KKBK": "Kotak Mahindra Bank",
+    "PUNB": "Punjab National Bank",
+    "BARB": "Bank of Baroda",
+    "UBIN": "Union Bank of India",
+})
+
+# Mock IFSC lookup: bank code -> (bank name, city)
+_IFSC_LOOKUP = MappingProxyType({
+    "HDFC": ("HDFC Bank", "Mumbai"),
+    "ICIC": ("ICICI Bank", "Mumbai"),
+    "SBIN": ("State Bank of India", "Delhi"),
+    "AXIS": ("Axis Bank", "Bangalore"),
+})
+_IFSC_UNKNOWN = ("Unknown Bank", "Unknown City")
+
+
+def account_number_format_ok(account_number: str) -> bool:
+    """
+    Fast check for an already-clean account number: 9-18 ASCII digits.
+    Anything else (spaces, dashes, bad length) needs validate_account_number.
+    """
+    return (
+        9 <= len(account_number) <= 18
+        and account_number.isascii()
+        and account_number.isdigit()
+    )
+
+
 @tool_registry.register(
     name="penny_drop_verify",
     description="Perform penny drop verification on bank account",
@@ -67,18 +102,8 @@ def penny_drop_verify(
     name_match = 1.0 if expected_name else 0.8
     
     # Get bank name from IFSC (first 4 chars)
-    bank_codes = {
-        "HDFC": "HDFC Bank",
-        "ICIC": "ICICI Bank",
-        "SBIN": "State Bank of India",
-        "AXIS": "Axis Bank",
-        "KKBK": "Kotak Mahindra Bank",
-        "PUNB": "Punjab National Bank",
-        "BARB": "Bank of Baroda",
-        "UBIN": "Union Bank of India",
-    }
     bank_code = ifsc[:4].upper()
-    bank_name = bank_codes.get(bank_code, f"Bank ({bank_code})")
+    bank_name = _BANK_NAMES.get(bank_code, f"Bank ({bank_code})")
     
     return {
         "success": True,
@@ -136,15 +161,8 @@ def lookup_ifsc(ifsc: str) -> Dict[str, Any]:
         }
     
     # Mock response based on bank code
-    bank_codes = {
-        "HDFC": ("HDFC Bank", "Mumbai"),
-        "ICIC": ("ICICI Bank", "Mumbai"),
-        "SBIN": ("State Bank of India", "Delhi"),
-        "AXIS": ("Axis Bank", "Bangalore"),
-    }
-    
     bank_code = ifsc[:4].upper()
-    bank_info = bank_codes.get(bank_code, ("Unknown Bank", "Unknown City"))
+    bank_info = _IFSC_LOOKUP.get(bank_code, _IFSC_UNKNOWN)
     
     return {
         "found": True,
@@ -3,10 +3,26 @@ Document Tools - OCR, text extraction, and document validation.
 """
 
 import os
+import re
 from typing import Any, Dict, List
 from app.core.tool_registry import tool_registry
 
 
+# Fields validate_document_content looks for when none are given
+_DEFAULT_EXPECTED_FIELDS = ("PAN", "Name", "Government")
+
+# Keywords that raise OCR confidence, already lowercased
+_CONFIDENCE_KEYWORDS = ("pan", "aadhaar", "government", "income tax", "uidai")
+
+_PAN_SCAN_RE = re.compile(r'\b[A-Z]{5}[0-9]{4}[A-Z]\b')
+
+# Holder name near the PAN, tried in order
+_NAME_PATTERNS = tuple(re.compile(p) for p in (
+    r'Name[:\s]+([A-Z][A-Z\s]+)',
+    r'([A-Z][A-Z\s]{5,30})\s*\n.*PAN',
+))
+
+
 @tool_registry.register(
     name="extract_document_text",
     description="Extract text content from a document using OCR",
@@ -64,8 +80,8 @@ def extract_document_text(file_path: str, extract_tables: bool = False) -> Dict[
         full_text = "\n".join([d.page_content for d in docs])
         
         # Estimate confidence based on text length and keywords
-        keywords = ["PAN", "Aadhaar", "Government", "Income Tax", "UIDAI"]
-        found_keywords = sum(1 for k in keywords if k.lower() in full_text.lower())
+        text_lower = full_text.lower()
+        found_keywords = sum(1 for k in _CONFIDENCE_KEYWORDS if k in text_lower)
         confidence = min(0.95, 0.5 + (found_keywords * 0.1) + (min(len(full_text), 500) / 1000))
         
         return {
@@ -112,7 +128,7 @@ def validate_document_content(text: str, expected_fields: List[str] = None) -> D
     Check if document contains expected content.
     """
     if expected_fields is None:
-        expected_fields = ["PAN", "Name", "Government"]
+        expected_fields = _DEFAULT_EXPECTED_FIELDS
     
     text_lower = text.lower()
     
@@ -125,7 +141,8 @@ def validate_document_content(text: str, expected_fields: List[str] = None) -> D
         else:
             missing.append(field)
     
-    valid = len(missing) == 0 or len(found) >= len(expected_fields) * 0.5
+    # At least half found (nothing missing implies that too)
+    valid = 2 * len(found) >= len(expected_fields)
     confidence = len(found) / max(len(expected_fields), 1)
     
     return {
@@ -154,28 +171,22 @@ def extract_pan_from_document(text: str) -> Dict[str, Any]:
     """
     Extract PAN number from document text using regex.
     """
-    import re
-    
-    # PAN pattern
-    pan_pattern = r'\b[A-Z]{5}[0-9]{4}[A-Z]\b'
-    matches = re.findall(pan_pattern, text.upper())
+    text_upper = text.upper()
+    # Only the first PAN is reported - stop scanning at it
+    pan_match = _PAN_SCAN_RE.search(text_upper)
     
-    if matches:
+    if pan_match:
         # Try to extract name (usually near PAN)
         name = None
-        name_patterns = [
-            r'Name[:\s]+([A-Z][A-Z\s]+)',
-            r'([A-Z][A-Z\s]{5,30})\s*\n.*PAN',
-        ]
-        for pattern in name_patterns:
-            name_match = re.search(pattern, text.upper())
+        for pattern in _NAME_PATTERNS:
+            name_match = pattern.search(text_upper)
             if name_match:
                 name = name_match.group(1).strip()
                 break
         
         return {
             "found": True,
-            "pan": matches[0],
+            "pan": pan_match.group(),
             "name": name
         }
     
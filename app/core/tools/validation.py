@@ -3,10 +3,93 @@ Validation Tools - PAN, GSTIN, and other format validations.
 """
 
 import re
-from typing import Any, Dict
+from typing import Any, Dict, List
 from app.core.tool_registry import tool_registry
 
 
+_PAN_RE = re.compile(r'^[A-Z]{5}[0-9]{4}[A-Z]$')
+_GSTIN_RE = re.compile(r'^[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z][0-9A-Z]Z[0-9A-Z]$')
+_AADHAAR_RE = re.compile(r'^[2-9][0-9]{11}$')
+_AADHAAR_SEPARATORS_RE = re.compile(r'[\s-]')
+
+# Verhoeff tables, flattened row-major: dihedral group D5 multiplication
+# (10x10) and the position permutation (8x10)
+_VERHOEFF_D = bytes((
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9,
+    1, 2, 3, 4, 0, 6, 7, 8, 9, 5,
+    2, 3, 4, 0, 1, 7, 8, 9, 5, 6,
+    3, 4, 0, 1, 2, 8, 9, 5, 6, 7,
+    4, 0, 1, 2, 3, 9, 5, 6, 7, 8,
+    5, 9, 8, 7, 6, 0, 4, 3, 2, 1,
+    6, 5, 9, 8, 7, 1, 0, 4, 3, 2,
+    7, 6, 5, 9, 8, 2, 1, 0, 4, 3,
+    8, 7, 6, 5, 9, 3, 2, 1, 0, 4,
+    9, 8, 7, 6, 5, 4, 3, 2, 1, 0,
+))
+_VERHOEFF_P = bytes((
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9,
+    1, 5, 7, 6, 2, 8, 3, 0, 9, 4,
+    5, 8, 0, 3, 7, 9, 6, 1, 4, 2,
+    8, 9, 1, 6, 0, 4, 3, 5, 2, 7,
+    9, 4, 5, 3, 1, 2, 7, 8, 6, 0,
+    4, 2, 8, 6, 5, 7, 3, 9, 0, 1,
+    2, 7, 9, 3, 8, 0, 6, 4, 1, 5,
+    7, 0, 4, 6, 9, 1, 3, 2, 5, 8,
+))
+
+# 4th PAN character indicates holder type
+PAN_HOLDER_TYPES = {
+    'A': 'Association of Persons (AOP)',
+    'B': 'Body of Individuals (BOI)',
+    'C': 'Company',
+    'F': 'Firm',
+    'G': 'Government',
+    'H': 'Hindu Undivided Family (HUF)',
+    'L': 'Local Authority',
+    'J': 'Artificial Juridical Person',
+    'P': 'Individual',
+    'T': 'Trust (AOP)',
+    'K': 'Krishi',
+}
+
+
+def pan_format_ok(pan: str) -> bool:
+    """Fast check for an already-normalized, well-formed PAN."""
+    return _PAN_RE.fullmatch(pan) is not None
+
+
+def gstin_format_ok(gstin: str) -> bool:
+    """Fast check for an already-normalized GSTIN with a valid state code."""
+    return _GSTIN_RE.fullmatch(gstin) is not None and 1 <= int(gstin[:2]) <= 37
+
+
+def verhoeff_ok(digits: str) -> bool:
+    """
+    Verhoeff checksum over an ASCII digit string (check digit last).
+    Pure table lookups - no branches on the digit values.
+    """
+    c = 0
+    for i, ch in enumerate(reversed(digits.encode("ascii"))):
+        c = _VERHOEFF_D[c * 10 + _VERHOEFF_P[(i & 7) * 10 + ch - 48]]
+    return c == 0
+
+
+def ifsc_format_ok(ifsc: str) -> bool:
+    """
+    Straight-line IFSC format check, equivalent to ^[A-Z]{4}0[A-Z0-9]{6}$
+    on an already upper-cased code. No regex engine involved.
+    """
+    return (
+        len(ifsc) == 11
+        and ifsc.isascii()
+        and ifsc[4] == "0"
+        and ifsc[:4].isalpha()
+        and ifsc[:4].isupper()
+        and ifsc[5:].isalnum()
+        and ifsc[5:] == ifsc[5:].upper()
+    )
+
+
 @tool_registry.register(
     name="validate_pan",
     description="Validate PAN (Permanent Account Number) format",
@@ -34,31 +117,15 @@ def validate_pan(pan: str) -> Dict[str, Any]:
     pan = pan.upper().strip()
     
     # Format check
-    pattern = r'^[A-Z]{5}[0-9]{4}[A-Z]$'
-    if not re.match(pattern, pan):
+    if not _PAN_RE.match(pan):
         return {
             "valid": False, 
             "error": "Invalid format. PAN must be 10 characters: 5 letters + 4 digits + 1 letter",
             "parsed": None
         }
     
-    # 4th character indicates holder type
-    holder_types = {
-        'A': 'Association of Persons (AOP)',
-        'B': 'Body of Individuals (BOI)',
-        'C': 'Company',
-        'F': 'Firm',
-        'G': 'Government',
-        'H': 'Hindu Undivided Family (HUF)',
-        'L': 'Local Authority',
-        'J': 'Artificial Juridical Person',
-        'P': 'Individual',
-        'T': 'Trust (AOP)',
-        'K': 'Krishi',
-    }
-    
     fourth_char = pan[3]
-    holder_type = holder_types.get(fourth_char, 'Unknown')
+    holder_type = PAN_HOLDER_TYPES.get(fourth_char, 'Unknown')
     
     return {
         "valid": True,
@@ -71,6 +138,35 @@ def validate_pan(pan: str) -> Dict[str, Any]:
     }
 
 
+@tool_registry.register(
+    name="validate_pan_batch",
+    description="Validate the format of many PANs at once (bulk import)",
+    input_schema={
+        "pans": {"type": "array", "items": {"type": "string"}, "description": "PAN numbers to validate"}
+    },
+    output_schema={
+        "valid": {"type": "array", "items": {"type": "boolean"}},
+        "valid_count": {"type": "integer"}
+    },
+    category="validation",
+)
+def validate_pan_batch(pans: List[str]) -> Dict[str, Any]:
+    """
+    Format-only validate_pan over a list: one flag per input, in order.
+    Same normalization and pattern as validate_pan, without building a
+    result dict per PAN.
+    """
+    match = _PAN_RE.match
+    valid = [bool(pan) and match(pan.upper().strip()) is not None for pan in pans]
+    return {"valid": valid, "valid_count": sum(valid)}
+
+
+@tool_registry.register_mock("validate_pan_batch")
+def mock_validate_pan_batch(pans: List[str]) -> Dict[str, Any]:
+    """Mock mode: every PAN passes, still one flag per input."""
+    return {"valid": [True] * len(pans), "valid_count": len(pans)}
+
+
 @tool_registry.register(
     name="validate_gstin",
     description="Validate GSTIN (Goods and Services Tax Identification Number) format",
@@ -100,8 +196,7 @@ def validate_gstin(gstin: str) -> Dict[str, Any]:
     gstin = gstin.upper().strip()
     
     # Format check
-    pattern = r'^[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z][0-9A-Z]Z[0-9A-Z]$'
-    if not re.match(pattern, gstin):
+    if not _GSTIN_RE.match(gstin):
         return {
             "valid": False,
             "error": "Invalid format. GSTIN must be 15 characters: 2 digits + 10 char PAN + entity code + Z + check digit",
@@ -158,8 +253,7 @@ def validate_ifsc(ifsc: str) -> Dict[str, Any]:
     ifsc = ifsc.upper().strip()
     
     # Format check
-    pattern = r'^[A-Z]{4}0[A-Z0-9]{6}$'
-    if not re.match(pattern, ifsc):
+    if not ifsc_format_ok(ifsc):
         return {
             "valid": False,
             "error": "Invalid format. IFSC must be 11 characters: 4 letters + 0 + 6 alphanumeric",
@@ -178,9 +272,10 @@ def validate_ifsc(ifsc: str) -> Dict[str, Any]:
 
 @tool_registry.register(
     name="validate_aadhaar",
-    description="Validate Aadhaar number format (basic check)",
+    description="Validate Aadhaar number format (basic check, optional checksum)",
     input_schema={
-        "aadhaar": {"type": "string", "description": "Aadhaar number to validate"}
+        "aadhaar": {"type": "string", "description": "Aadhaar number to validate"},
+        "verify_checksum": {"type": "boolean", "description": "Also verify the Verhoeff check digit", "default": False}
     },
     output_schema={
         "valid": {"type": "boolean"},
@@ -189,23 +284,27 @@ def validate_ifsc(ifsc: str) -> Dict[str, Any]:
     category="validation",
     mock_output={"valid": True, "error": None}
 )
-def validate_aadhaar(aadhaar: str) -> Dict[str, Any]:
+def validate_aadhaar(aadhaar: str, verify_checksum: bool = False) -> Dict[str, Any]:
     """
     Validate Aadhaar format: 12 digits, cannot start with 0 or 1.
-    Note: This is format validation only, not Verhoeff checksum.
+    With verify_checksum, the last digit must also be the Verhoeff check
+    digit of the first 11.
     """
     if not aadhaar:
         return {"valid": False, "error": "Aadhaar is required"}
     
     # Remove spaces and hyphens
-    aadhaar = re.sub(r'[\s-]', '', aadhaar)
+    aadhaar = _AADHAAR_SEPARATORS_RE.sub('', aadhaar)
     
     # Must be 12 digits
-    if not re.match(r'^[2-9][0-9]{11}$', aadhaar):
+    if not _AADHAAR_RE.match(aadhaar):
         return {
             "valid": False,
             "error": "Invalid format. Aadhaar must be 12 digits and cannot start with 0 or 1"
         }
     
+    if verify_checksum and not verhoeff_ok(aadhaar):
+        return {"valid": False, "error": "Invalid Aadhaar number (checksum mismatch)"}
+    
     return {"valid": True, "error": None}
 
@@ -2,11 +2,71 @@
 Web Tools - Website compliance checks, SSL verification, page fetching.
 """
 
+import asyncio
 import re
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
 from app.core.tool_registry import tool_registry
 
 
+# Page bodies are streamed and cut off here - policy links and contact
+# details sit well inside the first megabyte, and oversized pages are
+# neither downloaded in full nor held in memory
+MAX_PAGE_BYTES = 1024 * 1024
+
+# Pages fetch_many keeps in flight at once - well under the shared pool's
+# HTTP_LIMITS, so one crawl can't take every connection
+FETCH_CONCURRENCY = 16
+
+
+def _page_result(response: httpx.Response, chunks: List[bytes]) -> Dict[str, Any]:
+    """Fetch result from a streamed (possibly truncated) response body."""
+    body = b"".join(chunks)[:MAX_PAGE_BYTES]
+    return {
+        "success": response.status_code == 200,
+        "html": body.decode(response.encoding or "utf-8", errors="replace"),
+        "status_code": response.status_code,
+        "error": None if response.status_code == 200 else f"HTTP {response.status_code}"
+    }
+
+
+# Valid certificates per hostname - repeat checks (retries, other paths or
+# merchants on the same host) skip the TLS handshake. Failures aren't
+# cached so a fixed certificate is seen on the next check.
+SSL_CACHE_MAX_ENTRIES = 1024
+SSL_CACHE_TTL_S = 3600
+
+_ssl_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_ssl_cache_lock = threading.Lock()
+
+
+def _ssl_cache_get(hostname: str) -> Optional[Dict[str, Any]]:
+    """Cached check_ssl result for hostname, if still fresh."""
+    with _ssl_cache_lock:
+        entry = _ssl_cache.get(hostname)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > SSL_CACHE_TTL_S:
+            del _ssl_cache[hostname]
+            return None
+        _ssl_cache.move_to_end(hostname)
+    return dict(result)
+
+
+def _ssl_cache_put(hostname: str, result: Dict[str, Any]):
+    with _ssl_cache_lock:
+        _ssl_cache[hostname] = (time.monotonic(), dict(result))
+        _ssl_cache.move_to_end(hostname)
+        if len(_ssl_cache) > SSL_CACHE_MAX_ENTRIES:
+            _ssl_cache.popitem(last=False)
+
+
 @tool_registry.register(
     name="check_ssl",
     description="Check if a website has valid SSL/HTTPS",
@@ -50,6 +110,11 @@ def check_ssl(url: str) -> Dict[str, Any]:
                 "error": "Invalid URL"
             }
         
+        hostname = hostname.lower()
+        cached = _ssl_cache_get(hostname)
+        if cached is not None:
+            return cached
+        
         # Check if URL uses HTTPS
         if not url.startswith('https://'):
             # Try to connect anyway to see if SSL is available
@@ -69,12 +134,14 @@ def check_ssl(url: str) -> Dict[str, Any]:
                 else:
                     days_until_expiry = None
                 
-                return {
+                result = {
                     "has_ssl": True,
                     "certificate_valid": True,
                     "expiry_days": days_until_expiry,
                     "error": None
                 }
+                _ssl_cache_put(hostname, result)
+                return result
                 
     except ssl.SSLError as e:
         return {
@@ -124,21 +191,20 @@ def check_ssl(url: str) -> Dict[str, Any]:
 )
 async def fetch_webpage(url: str, timeout: int = 30) -> Dict[str, Any]:
     """
-    Fetch webpage content using async HTTP client.
+    Fetch webpage content using the shared async HTTP client.
+    
+    Reads at most MAX_PAGE_BYTES of the body.
     """
     try:
-        import httpx
+        async with tool_registry.http.stream("GET", url, timeout=timeout) as response:
+            chunks, size = [], 0
+            async for chunk in response.aiter_bytes():
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= MAX_PAGE_BYTES:
+                    break
+            return _page_result(response, chunks)
         
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-            response = await client.get(url)
-            
-            return {
-                "success": response.status_code == 200,
-                "html": response.text,
-                "status_code": response.status_code,
-                "error": None if response.status_code == 200 else f"HTTP {response.status_code}"
-            }
-            
     except Exception as e:
         return {
             "success": False,
@@ -173,21 +239,20 @@ async def fetch_webpage(url: str, timeout: int = 30) -> Dict[str, Any]:
 )
 def fetch_webpage_sync(url: str, timeout: int = 30) -> Dict[str, Any]:
     """
-    Fetch webpage content using sync HTTP client.
+    Fetch webpage content using the shared sync HTTP client.
+    
+    Reads at most MAX_PAGE_BYTES of the body.
     """
     try:
-        import httpx
+        with tool_registry.http_sync.stream("GET", url, timeout=timeout) as response:
+            chunks, size = [], 0
+            for chunk in response.iter_bytes():
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= MAX_PAGE_BYTES:
+                    break
+            return _page_result(response, chunks)
         
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            response = client.get(url)
-            
-            return {
-                "success": response.status_code == 200,
-                "html": response.text,
-                "status_code": response.status_code,
-                "error": None if response.status_code == 200 else f"HTTP {response.status_code}"
-            }
-            
     except Exception as e:
         return {
             "success": False,
@@ -197,6 +262,73 @@ def fetch_webpage_sync(url: str, timeout: int = 30) -> Dict[str, Any]:
         }
 
 
+async def fetch_many(
+    urls: Iterable[str],
+    limit: int = FETCH_CONCURRENCY,
+    timeout: int = 30,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch several pages concurrently, at most `limit` at a time.
+    
+    Results are fetch_webpage results, in the order of `urls`.
+    """
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def fetch_one(url: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await fetch_webpage(url, timeout)
+    
+    return await asyncio.gather(*(fetch_one(url) for url in urls))
+
+
+# Policy detection patterns, compiled once. Literal-led patterns let the
+# regex engine skip ahead to their prefix, so those scans are cheap.
+_PRIVACY_PATTERNS = tuple(re.compile(p) for p in (
+    r'privacy\s*policy',
+    r'href=["\'][^"\']*privacy[^"\']*["\']',
+    r'data\s*protection',
+))
+
+_TERMS_PATTERNS = tuple(re.compile(p) for p in (
+    r'terms\s*(of\s*)?(service|use|conditions)',
+    r'href=["\'][^"\']*terms[^"\']*["\']',
+    r'user\s*agreement',
+))
+
+_REFUND_PATTERNS = tuple(re.compile(p) for p in (
+    r'refund\s*policy',
+    r'return\s*policy',
+    r'cancellation\s*policy',
+    r'href=["\'][^"\']*refund[^"\']*["\']',
+    r'href=["\'][^"\']*return[^"\']*["\']',
+))
+
+_CONTACT_PATTERNS = tuple(re.compile(p) for p in (
+    r'contact\s*us',
+    r'mailto:',
+))
+
+# Phone: finds a match exactly when \+?\d{10,} does, but never retries
+# the optional "+" and unbounded repeat at every digit
+_PHONE_RE = re.compile(r'\d{10}')
+
+# Email ([\w.+-]+@[\w-]+\.[\w.-]+) is checked from each "@" outwards -
+# a leading [\w.+-]+ pattern would start a match at every word character
+_EMAIL_LOCAL_CHAR = re.compile(r'[\w.+-]')
+_EMAIL_DOMAIN = re.compile(r'@[\w-]+\.[\w.-]+')
+
+_POLICY_LINK_RE = re.compile(r'href=["\']([^"\']*(?:privacy|terms|refund|return|contact)[^"\']*)["\']')
+
+
+def _has_email(text: str) -> bool:
+    at = text.find("@", 1)
+    while at != -1:
+        if _EMAIL_LOCAL_CHAR.match(text, at - 1) and _EMAIL_DOMAIN.match(text, at):
+            return True
+        at = text.find("@", at + 1)
+    return False
+
+
 @tool_registry.register(
     name="check_page_policies",
     description="Check if webpage has required policy pages (Privacy, Terms, Refund)",
@@ -226,54 +358,78 @@ def check_page_policies(html: str, base_url: str = "") -> Dict[str, Any]:
     """
     html_lower = html.lower()
     
-    # Privacy policy patterns
-    privacy_patterns = [
-        r'privacy\s*policy',
-        r'href=["\'][^"\']*privacy[^"\']*["\']',
-        r'data\s*protection',
-    ]
-    has_privacy = any(re.search(p, html_lower) for p in privacy_patterns)
-    
-    # Terms patterns
-    terms_patterns = [
-        r'terms\s*(of\s*)?(service|use|conditions)',
-        r'href=["\'][^"\']*terms[^"\']*["\']',
-        r'user\s*agreement',
-    ]
-    has_terms = any(re.search(p, html_lower) for p in terms_patterns)
-    
-    # Refund patterns
-    refund_patterns = [
-        r'refund\s*policy',
-        r'return\s*policy',
-        r'cancellation\s*policy',
-        r'href=["\'][^"\']*refund[^"\']*["\']',
-        r'href=["\'][^"\']*return[^"\']*["\']',
-    ]
-    has_refund = any(re.search(p, html_lower) for p in refund_patterns)
-    
-    # Contact info patterns
-    contact_patterns = [
-        r'contact\s*us',
-        r'[\w.+-]+@[\w-]+\.[\w.-]+',  # Email
-        r'\+?\d{10,}',  # Phone
-        r'mailto:',
-    ]
-    has_contact = any(re.search(p, html_lower) for p in contact_patterns)
+    # Extract policy links - first 10 distinct, in page order, so the scan
+    # can stop at the 10th
+    found_links = []
+    for match in _POLICY_LINK_RE.finditer(html_lower):
+        link = match.group(1)
+        if link not in found_links:
+            found_links.append(link)
+            if len(found_links) == 10:
+                break
     
-    # Extract policy links
-    link_pattern = r'href=["\']([^"\']*(?:privacy|terms|refund|return|contact)[^"\']*)["\']'
-    found_links = list(set(re.findall(link_pattern, html_lower)))
+    has_privacy = any(p.search(html_lower) for p in _PRIVACY_PATTERNS)
+    has_terms = any(p.search(html_lower) for p in _TERMS_PATTERNS)
+    has_refund = any(p.search(html_lower) for p in _REFUND_PATTERNS)
+    has_contact = (
+        any(p.search(html_lower) for p in _CONTACT_PATTERNS)
+        or _has_email(html_lower)
+        or _PHONE_RE.search(html_lower) is not None
+    )
     
     return {
         "has_privacy_policy": has_privacy,
         "has_terms": has_terms,
         "has_refund_policy": has_refund,
         "has_contact_info": has_contact,
-        "found_links": found_links[:10]  # Limit to 10
+        "found_links": found_links
     }
 
 
+class _SharedBrowser:
+    """
+    Headless Chromium launched on first use and reused across screenshots.
+    
+    Playwright objects belong to the event loop that started them, so a
+    call from a different loop launches a fresh browser.
+    """
+    
+    def __init__(self):
+        self._playwright = None
+        self._browser = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+    
+    async def get(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._playwright = self._browser = None
+            self._loop, self._lock = loop, asyncio.Lock()
+        
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    from playwright.async_api import async_playwright
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+        return self._browser
+    
+    async def close(self):
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._playwright = self._browser = self._loop = self._lock = None
+
+
+_shared_browser = _SharedBrowser()
+
+
+async def close_browser():
+    """Close the shared screenshot browser (call from the app shutdown hook)."""
+    await _shared_browser.close()
+
+
 @tool_registry.register(
     name="take_screenshot",
     description="Take a screenshot of a webpage",
@@ -298,20 +454,24 @@ def check_page_policies(html: str, base_url: str = "") -> Dict[str, Any]:
 async def take_screenshot(url: str, output_path: str) -> Dict[str, Any]:
     """
     Take screenshot using Playwright.
+    
+    Uses the shared browser - each call only opens (and closes) its own
+    context, so cookies and storage never leak between screenshots.
     """
     try:
-        from playwright.async_api import async_playwright
         import os
         
         # Ensure output directory exists
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        browser = await _shared_browser.get()
+        context = await browser.new_context()
+        try:
+            page = await context.new_page()
             await page.goto(url, timeout=30000)
             await page.screenshot(path=output_path, full_page=True)
-            await browser.close()
+        finally:
+            await context.close()
         
         return {
             "success": True,
@@ -1,6 +1,7 @@
-from typing import Literal
-from langgraph.graph import StateGraph, END
+from functools import lru_cache, partial
+from typing import List, Union
 from langgraph.graph import StateGraph, END
+import os
 from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 import aiosqlite
 
@@ -9,13 +10,74 @@ from app.nodes.input_parser import input_parser_node
 from app.nodes.verifiers import (
     doc_intelligence_node,
     bank_verifier_node,
+    aggregator_node,
     finalizer_node,
 )
 from app.nodes.consultant import consultant_fixer_node
 from app.nodes.web_compliance import web_compliance_node
-
-
-def build_graph():
+from app.utils.simulation import sim
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Verifiers with no data dependencies on each other - run in parallel
+VERIFIER_NODES = [
+    "doc_intelligence_node",
+    "bank_verifier_node",
+    "web_compliance_node",
+]
+
+# Conditional routing table: source node -> (state flags, next if all set, next otherwise)
+_ROUTES = {
+    # Input Parser -> all verifiers in parallel, or Consultant
+    "input_parser_node": (("is_auth_valid",), VERIFIER_NODES, "consultant_fixer_node"),
+    # Aggregator (all verifiers finished) -> Finalizer or Consultant
+    "aggregator_node": (
+        ("is_doc_verified", "is_bank_verified", "is_website_compliant"),
+        "finalizer_node",
+        "consultant_fixer_node",
+    ),
+}
+
+
+# Routes the "sim" profile may fold: simulation keys of the nodes that set
+# the route's flags, for nodes that can't fail once force-succeeded (see
+# app.utils.simulation). The aggregator route stays conditional - the web
+# node still fails a missing website URL under force success.
+_SIM_KEYS = {
+    "input_parser_node": ("input",),
+}
+
+# "prod" keeps every check conditional. "sim" turns a check whose flags
+# all come from force-succeeded nodes into direct edges - only for demo
+# deployments that pin SIMULATE_FORCE_SUCCESS_* and never toggle flags
+# at runtime.
+GRAPH_PROFILE = os.getenv("GRAPH_PROFILE", "prod")
+
+
+def route(state: AgentState, src: str) -> Union[str, List[str]]:
+    flags, yes, no = _ROUTES[src]
+    return yes if all(state.get(flag) for flag in flags) else no
+
+
+def _can_fold(src: str) -> bool:
+    """
+    True if src's route is fixed for this process: its nodes skip their
+    checks (dev mode only) because of env-pinned force success. The graph
+    is built once, so flags toggled at runtime wouldn't re-route it.
+    """
+    keys = _SIM_KEYS.get(src)
+    if not keys or not all(sim.should_skip(key) and sim.is_forced_success(key) for key in keys):
+        return False
+    if sim.has_runtime_flags():
+        logger.warning("GRAPH_PROFILE=sim: runtime simulation flags set, keeping %s routing conditional", src)
+        return False
+    logger.warning("GRAPH_PROFILE=sim: %s routes directly; runtime flag changes won't re-route it", src)
+    return True
+
+
+def build_graph(profile: str = GRAPH_PROFILE):
     workflow = StateGraph(AgentState)
 
     # Add Nodes
@@ -23,53 +85,25 @@ def build_graph():
     workflow.add_node("doc_intelligence_node", doc_intelligence_node)
     workflow.add_node("bank_verifier_node", bank_verifier_node)
     workflow.add_node("web_compliance_node", web_compliance_node)
+    workflow.add_node("aggregator_node", aggregator_node)
     workflow.add_node("consultant_fixer_node", consultant_fixer_node)
     workflow.add_node("finalizer_node", finalizer_node)
 
-    # Define Conditional Logic
-
-    def check_auth(
-        state: AgentState,
-    ) -> Literal["doc_intelligence_node", "consultant_fixer_node"]:
-        if state.get("is_auth_valid"):
-            return "doc_intelligence_node"
-        return "consultant_fixer_node"
-
-    def check_docs(
-        state: AgentState,
-    ) -> Literal["bank_verifier_node", "consultant_fixer_node"]:
-        # Assuming doc always passes for now, but good to have logic
-        if state.get("is_doc_verified"):
-            return "bank_verifier_node"
-        return "consultant_fixer_node"
-
-    def check_bank(
-        state: AgentState,
-    ) -> Literal["web_compliance_node", "consultant_fixer_node"]:
-        if state.get("is_bank_verified"):
-            return "web_compliance_node"
-        return "consultant_fixer_node"
-
-    def check_compliance(
-        state: AgentState,
-    ) -> Literal["finalizer_node", "consultant_fixer_node"]:
-        if state.get("is_website_compliant"):
-            return "finalizer_node"
-        return "consultant_fixer_node"
-
     # Add Edges
     workflow.set_entry_point("input_parser_node")
 
-    workflow.add_conditional_edges("input_parser_node", check_auth)
-
-    # Doc intelligence -> Bank Verifier or Consultant (if docs are blurry/invalid)
-    workflow.add_conditional_edges("doc_intelligence_node", check_docs)
+    # One table-driven router for every conditional edge, folded to
+    # direct edges where the answer is fixed at build time
+    for src, (_, yes, no) in _ROUTES.items():
+        targets = yes if isinstance(yes, list) else [yes]
+        if profile == "sim" and _can_fold(src):
+            for target in targets:
+                workflow.add_edge(src, target)
+        else:
+            workflow.add_conditional_edges(src, partial(route, src=src), [*targets, no])
 
-    # Bank Verifier -> Web Compliance or Consultant
-    workflow.add_conditional_edges("bank_verifier_node", check_bank)
-
-    # Web Compliance -> Finalizer or Consultant
-    workflow.add_conditional_edges("web_compliance_node", check_compliance)
+    # Aggregator waits for every verifier branch to finish
+    workflow.add_edge(VERIFIER_NODES, "aggregator_node")
 
     # Consultant Logic for Retry
     # If consultant runs, it means there was an error.
@@ -87,5 +121,19 @@ def build_graph():
     return workflow
 
 
-# We no longer export a compiled 'graph' here.
-# Main.py will use build_graph() and compile it with the checkpointer.
+# Pause for merchant input after the consultant has listed action items
+INTERRUPT_AFTER = ["consultant_fixer_node"]
+
+
+@lru_cache(maxsize=1)
+def get_graph(checkpointer=None):
+    """
+    Compile the workflow once per process and share the result.
+
+    The checkpointer is opened by main.py at startup, so compilation
+    happens there (in the FastAPI lifespan) rather than at import time.
+    Repeat calls with the same checkpointer return the same compiled graph.
+    """
+    return build_graph().compile(
+        checkpointer=checkpointer, interrupt_after=INTERRUPT_AFTER
+    )
@@ -14,7 +14,7 @@ The nodes are backward compatible with LangGraph - they still
 accept AgentState and return Dict[str, Any].
 """
 
-from typing import Literal
+from typing import List, Literal, Union
 from langgraph.graph import StateGraph, END
 import os
 
@@ -29,19 +29,33 @@ from app.core.nodes import (
     DocIntelligenceNode,
     BankVerifierNode,
     WebComplianceNode,
+    AggregatorNode,
     ConsultantNode,
     FinalizerNode,
 )
 
 
+# Verifiers with no data dependencies on each other - run in parallel
+VERIFIER_NODES = [
+    "doc_intelligence_node",
+    "bank_verifier_node",
+    "web_compliance_node",
+]
+
+
 def build_graph():
     """
     Build the workflow graph using new architecture nodes.
     
-    The graph structure is the same as v1, but nodes use:
+    Nodes use:
     - Clear input/output contracts
     - Tool registry for external calls
     - Simulation support built-in
+    
+    After the input parser, the document, bank and web compliance
+    verifiers fan out in parallel and join in the aggregator, so
+    verification takes as long as the slowest check rather than the
+    sum of all three.
     """
     workflow = StateGraph(AgentState)
     
@@ -50,6 +64,7 @@ def build_graph():
     doc_intelligence = DocIntelligenceNode()
     bank_verifier = BankVerifierNode()
     web_compliance = WebComplianceNode()
+    aggregator = AggregatorNode()
     consultant = ConsultantNode()
     finalizer = FinalizerNode()
     
@@ -58,45 +73,42 @@ def build_graph():
     workflow.add_node("doc_intelligence_node", doc_intelligence)
     workflow.add_node("bank_verifier_node", bank_verifier)
     workflow.add_node("web_compliance_node", web_compliance)
+    workflow.add_node("aggregator_node", aggregator)
     workflow.add_node("consultant_fixer_node", consultant)
     workflow.add_node("finalizer_node", finalizer)
     
-    # Define Conditional Logic (same as v1)
+    # Define Conditional Logic
     def check_auth(
         state: AgentState,
-    ) -> Literal["doc_intelligence_node", "consultant_fixer_node"]:
+    ) -> Union[List[str], Literal["consultant_fixer_node"]]:
         if state.get("is_auth_valid"):
-            return "doc_intelligence_node"
-        return "consultant_fixer_node"
-    
-    def check_docs(
-        state: AgentState,
-    ) -> Literal["bank_verifier_node", "consultant_fixer_node"]:
-        if state.get("is_doc_verified"):
-            return "bank_verifier_node"
+            return VERIFIER_NODES
         return "consultant_fixer_node"
     
-    def check_bank(
-        state: AgentState,
-    ) -> Literal["web_compliance_node", "consultant_fixer_node"]:
-        if state.get("is_bank_verified"):
-            return "web_compliance_node"
-        return "consultant_fixer_node"
-    
-    def check_compliance(
+    def check_verification(
         state: AgentState,
     ) -> Literal["finalizer_node", "consultant_fixer_node"]:
-        if state.get("is_website_compliant"):
+        if (
+            state.get("is_doc_verified")
+            and state.get("is_bank_verified")
+            and state.get("is_website_compliant")
+        ):
             return "finalizer_node"
         return "consultant_fixer_node"
     
     # Add Edges
     workflow.set_entry_point("input_parser_node")
     
-    workflow.add_conditional_edges("input_parser_node", check_auth)
-    workflow.add_conditional_edges("doc_intelligence_node", check_docs)
-    workflow.add_conditional_edges("bank_verifier_node", check_bank)
-    workflow.add_conditional_edges("web_compliance_node", check_compliance)
+    # Input parser -> all verifiers in parallel, or Consultant
+    workflow.add_conditional_edges(
+        "input_parser_node",
+        check_auth,
+        [*VERIFIER_NODES, "consultant_fixer_node"],
+    )
+    
+    # Aggregator waits for every verifier branch to finish
+    workflow.add_edge(VERIFIER_NODES, "aggregator_node")
+    workflow.add_conditional_edges("aggregator_node", check_verification)
     
     # Consultant routes back to input for retry
     workflow.add_edge("consultant_fixer_node", "input_parser_node")
@@ -121,6 +133,7 @@ def get_node_configs():
         "doc_intelligence_node": DocIntelligenceNode.get_config().model_dump(),
         "bank_verifier_node": BankVerifierNode.get_config().model_dump(),
         "web_compliance_node": WebComplianceNode.get_config().model_dump(),
+        "aggregator_node": AggregatorNode.get_config().model_dump(),
         "consultant_fixer_node": ConsultantNode.get_config().model_dump(),
         "finalizer_node": FinalizerNode.get_config().model_dump(),
     }
@@ -8,10 +8,12 @@ including document upload, status checking, and workflow management.
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Query, UploadFile, File
 from fastapi.responses import FileResponse
 from app.schema import MerchantApplication, ResumePayload, JobStatus
-from app.graph import build_graph
+from app.graph import get_graph
 from typing import List, Optional
 from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from fastapi.staticfiles import StaticFiles
+from app.core.tool_registry import tool_registry
+from app.core.tools.web import close_browser
 from app.utils import job_store
 from app.utils.logger import get_logger
 from contextlib import asynccontextmanager
@@ -37,13 +39,13 @@ async def lifespan(app: FastAPI):
         "db/checkpoints.sqlite"
     ) as checkpointer:
         global agent_app
-        workflow = build_graph()
-        agent_app = workflow.compile(
-            checkpointer=checkpointer, interrupt_after=["consultant_fixer_node"]
-        )
+        agent_app = get_graph(checkpointer)
         logger.info("Workflow graph compiled with persistence")
         yield
 
+    await tool_registry.aclose_http()
+    await close_browser()
+
 
 app = FastAPI(title="Project Velocity Agent", version="1.0", lifespan=lifespan)
 
@@ -8,6 +8,7 @@ This node:
 - Generates correction plan
 """
 
+from collections import Counter
 from typing import Any, Dict, List
 from app.schema import AgentState, ActionItem, ActionCategory, ActionSeverity
 from app.utils.logger import get_logger
@@ -100,6 +101,11 @@ Output ONLY valid JSON, no additional text."""
     return action_items
 
 
+def _sort_key(item: Dict[str, Any]) -> tuple:
+    """BLOCKING first, then by creation time (computed once per item by sort)."""
+    return (0 if item.get("severity") == "BLOCKING" else 1, item.get("created_at", ""))
+
+
 def consultant_fixer_node(state: AgentState) -> Dict[str, Any]:
     """Consolidate action items and generate merchant recommendations."""
     logger.info("Consultant node started")
@@ -114,8 +120,9 @@ def consultant_fixer_node(state: AgentState) -> Dict[str, Any]:
     
     logger.debug("Received %d action items for review", len(action_items))
     
-    blocking_count = sum(1 for item in action_items if item.get("severity") == "BLOCKING")
-    warning_count = sum(1 for item in action_items if item.get("severity") == "WARNING")
+    severity_counts = Counter(item.get("severity") for item in action_items)
+    blocking_count = severity_counts["BLOCKING"]
+    warning_count = severity_counts["WARNING"]
     
     correction_plan = []
     for item in action_items:
@@ -128,10 +135,7 @@ def consultant_fixer_node(state: AgentState) -> Dict[str, Any]:
         logger.debug("Enriching action items with LLM")
         action_items = enrich_action_items_with_llm(action_items, state)
     
-    action_items.sort(key=lambda x: (
-        0 if x.get("severity") == "BLOCKING" else 1,
-        x.get("created_at", "")
-    ))
+    action_items.sort(key=_sort_key)
     
     summary = []
     if blocking_count > 0:
@@ -8,7 +8,7 @@ Validates:
 
 from typing import Any, Dict, List
 import re
-from app.schema import AgentState, ActionItem, ActionCategory, ActionSeverity
+from app.schema import AgentState, ActionItem, ActionCategory, ActionSeverity, start_pass
 from app.utils.simulation import sim
 from app.utils.logger import get_logger
 
@@ -42,6 +42,12 @@ def create_action_item(
 def input_parser_node(state: AgentState) -> Dict[str, Any]:
     """Validate initial application data including PAN and GSTIN formats."""
     logger.info("Input Parser node started")
+    # Every pass starts here - its result replaces the previous pass's
+    # action items, notes and error, whether it passes or fails
+    return start_pass(_parse_input(state), state)
+
+
+def _parse_input(state: AgentState) -> Dict[str, Any]:
     
     app_data = state.get("application_data", {})
     business_details = app_data.get("business_details", {})
@@ -4,6 +4,7 @@ Verification nodes for document and bank account validation.
 These nodes handle:
 - Document OCR and content extraction
 - Bank account verification via penny drop
+- Joining the parallel verifier branches
 - Final onboarding completion
 """
 
@@ -306,6 +307,26 @@ def bank_verifier_node(state: AgentState) -> Dict[str, Any]:
     }
 
 
+# (display name, state flag) of each parallel verifier
+_VERIFIER_CHECKS = (
+    ("Documents", "is_doc_verified"),
+    ("Bank", "is_bank_verified"),
+    ("Website", "is_website_compliant"),
+)
+
+
+def aggregator_node(state: AgentState) -> Dict[str, Any]:
+    """Join the parallel verifiers; clear the error once all of them passed."""
+    failed = [name for name, flag in _VERIFIER_CHECKS if not state.get(flag)]
+    if failed:
+        return {"verification_notes": [f"Verification failed: {', '.join(failed)}"]}
+
+    return {
+        "error_message": None,
+        "verification_notes": ["All verifications passed"],
+    }
+
+
 def finalizer_node(state: AgentState) -> Dict[str, Any]:
     """Complete the onboarding process and prepare for agreement generation."""
     logger.info("Finalizer node started")
@@ -439,11 +439,19 @@ async def web_compliance_node(state: AgentState) -> Dict[str, Any]:
     else:
         notes.append("SSL Check: PASSED")
 
-    # 1b. Adverse Media Scan
+    # 1b/1c lookups (search, WHOIS, DNS) are independent blocking network
+    # calls - run them in worker threads at the same time
     merchant_name = state["application_data"]["bank_details"].get(
         "account_holder_name", "Unknown Merchant"
     )
-    adverse_media = check_reputation(merchant_name)
+    domain = get_domain_from_url(url)
+    lookups = [asyncio.to_thread(check_reputation, merchant_name)]
+    if domain:
+        lookups.append(asyncio.to_thread(get_domain_age, domain))
+        lookups.append(asyncio.to_thread(has_mx_records, domain))
+    adverse_media, *domain_lookups = await asyncio.gather(*lookups)
+
+    # 1b. Adverse Media Scan
     if adverse_media:
         real_hits = [m for m in adverse_media if "Search failed" not in m]
         if real_hits:
@@ -459,9 +467,8 @@ async def web_compliance_node(state: AgentState) -> Dict[str, Any]:
         notes.extend(adverse_media)
 
     # 1c. Domain Verification
-    domain = get_domain_from_url(url)
     if domain:
-        age = get_domain_age(domain)
+        age, mx_valid = domain_lookups
         if age != -1:
             notes.append(f"Domain Age: {age} days")
             if age < 30:
@@ -477,7 +484,7 @@ async def web_compliance_node(state: AgentState) -> Dict[str, Any]:
         else:
             notes.append("Domain Age: Could not verify")
 
-        if not has_mx_records(domain):
+        if not mx_valid:
             issues.append("High Risk: Domain has no email (MX) records.")
             risk_score_increase += 0.5
             action_items.append(create_action_item(
@@ -1,9 +1,11 @@
 from typing import TypedDict, Annotated, List, Dict, Any, Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from langgraph.graph.message import add_messages
 from langchain_core.messages import BaseMessage
+from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
+from urllib.parse import urlsplit, urlunsplit
 import uuid
 
 
@@ -56,6 +58,29 @@ class ActionItem(BaseModel):
 # Pydantic Data Models (for validation)
 
 
+def normalize_website_url(url: str) -> str:
+    """
+    Canonical form of a merchant website URL.
+    
+    Adds https:// when no scheme is given, lowercases scheme and host and
+    drops trailing slashes, so one site always maps to one URL (and one
+    web check cache entry).
+    """
+    url = url.strip()
+    if not url:
+        return url
+    if not url.lower().startswith(("http://", "https://")):
+        url = f"https://{url}"
+    parts = urlsplit(url)
+    return urlunsplit((
+        parts.scheme,  # urlsplit already lowercases it
+        parts.netloc.lower(),
+        parts.path.rstrip("/"),
+        parts.query,
+        parts.fragment,
+    ))
+
+
 class BusinessDetails(BaseModel):
     pan: str
     entity_type: str
@@ -63,6 +88,11 @@ class BusinessDetails(BaseModel):
     gstin: str
     monthly_volume: str
     website_url: Optional[str] = None
+    
+    @field_validator("website_url")
+    @classmethod
+    def _normalize_website_url(cls, v: Optional[str]) -> Optional[str]:
+        return normalize_website_url(v) if v else v
 
 
 class BankDetails(BaseModel):
@@ -93,6 +123,11 @@ class PartialBusinessDetails(BaseModel):
     gstin: Optional[str] = None
     monthly_volume: Optional[str] = None
     website_url: Optional[str] = None
+    
+    @field_validator("website_url")
+    @classmethod
+    def _normalize_website_url(cls, v: Optional[str]) -> Optional[str]:
+        return normalize_website_url(v) if v else v
 
 
 class PartialBankDetails(BaseModel):
@@ -138,6 +173,111 @@ class ResumePayload(BaseModel):
 # --- Graph State (AgentState) ---
 
 
+@dataclass(frozen=True)
+class Replace:
+    """
+    Reducer update that overwrites the accumulated value instead of being
+    merged into it. Sent (via start_pass) when a new verification pass
+    starts, so nothing from an earlier pass survives a retry.
+    """
+    value: Any
+
+
+def _unwrap(current: Any) -> Any:
+    """
+    Value a reducer should merge into. LangGraph stores the first update
+    of an unset channel without calling its reducer, so a Replace can be
+    the current value there.
+    """
+    return current.value if isinstance(current, Replace) else current
+
+
+# Pipeline order of the stage values
+_STAGE_ORDER = {"INPUT": 0, "DOCS": 1, "BANK": 2, "COMPLIANCE": 3, "FINAL": 4}
+
+
+def furthest_stage(current: Optional[str], update: Any) -> str:
+    """
+    Reducer for stage.
+
+    The parallel verifiers each write their own stage; keeping the
+    furthest one gives the same result whatever order the writes are
+    applied in. A Replace update (new pass) resets it.
+    """
+    if isinstance(update, Replace):
+        return update.value
+    current = _unwrap(current)
+    if current is None:
+        return update
+    return max(current, update, key=_STAGE_ORDER.__getitem__)
+
+
+def merge_error_message(current: Optional[str], update: Any) -> Optional[str]:
+    """
+    Reducer for error_message.
+
+    Failures from parallel verifiers are combined, sorted, into one
+    "; "-separated message, so the result doesn't depend on which branch
+    is applied first. None clears it; a Replace update (new pass)
+    overwrites it.
+    """
+    if isinstance(update, Replace):
+        return update.value
+    current = _unwrap(current)
+    if update is None or current is None:
+        return update
+    return "; ".join(sorted(set(current.split("; ")) | {update}))
+
+
+def append_notes(current: Optional[List[str]], update: Any) -> List[str]:
+    """Reducer for verification_notes: appends, or restarts on a Replace."""
+    if isinstance(update, Replace):
+        return list(update.value)
+    return (_unwrap(current) or []) + update
+
+
+def merge_action_items(
+    current: Optional[List[Dict[str, Any]]],
+    update: Any,
+) -> List[Dict[str, Any]]:
+    """
+    Reducer for action_items.
+
+    Parallel verifier branches each contribute their own items, so updates
+    are merged by item id: items re-sent with the same id move to the end
+    in the order given, new ids are appended. A Replace update (new pass)
+    replaces the list.
+    """
+    if isinstance(update, Replace):
+        return list(update.value)
+    current = _unwrap(current)
+    if not current:
+        return list(update)
+    updated_ids = {item.get("id") for item in update}
+    return [item for item in current if item.get("id") not in updated_ids] + list(update)
+
+
+def start_pass(update: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    State update from the first node of a verification pass (the input
+    parser), on success and failure alike: its action items, notes, error
+    message and stage replace whatever earlier passes left.
+
+    Keys missing from state are unset channels - LangGraph stores their
+    first update as-is, so those get the plain value rather than a Replace.
+    """
+    reset = {
+        "action_items": list(update.get("action_items") or []),
+        "verification_notes": list(update.get("verification_notes") or []),
+        "error_message": update.get("error_message"),
+        "stage": update.get("stage", "INPUT"),
+    }
+    return {
+        **update,
+        **{key: Replace(value) if key in state else value for key, value in reset.items()},
+    }
+
+
 class IdentityState(TypedDict):
     """Holds core identity and application data."""
 
@@ -148,11 +288,11 @@ class IdentityState(TypedDict):
 class WorkflowState(TypedDict):
     """Tracks the execution flow and status of the agent."""
 
-    stage: Literal["INPUT", "DOCS", "BANK", "COMPLIANCE", "FINAL"]
+    stage: Annotated[Literal["INPUT", "DOCS", "BANK", "COMPLIANCE", "FINAL"], furthest_stage]
     status: Literal["IN_PROGRESS", "NEEDS_REVIEW", "COMPLETED", "REJECTED"]
     next_step: Optional[str]
     retry_count: int
-    error_message: Optional[str]
+    error_message: Annotated[Optional[str], merge_error_message]
     messages: Annotated[List[BaseMessage], add_messages]
 
 
@@ -169,11 +309,11 @@ class ConsultantState(TypedDict):
     """Data related to risk assessment and consultant feedback."""
 
     risk_score: float  # 0.0 to 1.0 (1.0 = High Risk)
-    verification_notes: List[str]
+    verification_notes: Annotated[List[str], append_notes]
     compliance_issues: List[str]
     missing_artifacts: List[str]
     consultant_plan: List[str]
-    action_items: List[Dict[str, Any]]  # List of ActionItem dicts (immutable, append-only)
+    action_items: Annotated[List[Dict[str, Any]], merge_action_items]  # ActionItem dicts, merged by id
 
 
 class AgentState(IdentityState, WorkflowState, ValidationState, ConsultantState):
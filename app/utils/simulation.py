@@ -26,6 +26,14 @@ from typing import Dict, List, Optional
 # Runtime overrides (in-memory, no restart needed)
 _runtime_flags: Dict[str, bool] = {}
 
+# Bumped on every runtime flag change so callers can cache lookups
+_flags_version = 0
+
+
+def _bump_version() -> None:
+    global _flags_version
+    _flags_version += 1
+
 
 class SimulationConfig:
     """Centralized simulation configuration."""
@@ -86,11 +94,17 @@ class SimulationConfig:
     
     # --- Runtime Flag Management ---
     
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever runtime flags change."""
+        return _flags_version
+    
     def set_flag(self, scenario: str, enabled: bool) -> bool:
         """Set a simulation flag at runtime (no restart needed)."""
         if scenario not in self.ALL_SCENARIOS:
             return False
         _runtime_flags[scenario] = enabled
+        _bump_version()
         return True
     
     def set_flags(self, flags: Dict[str, bool]) -> Dict[str, bool]:
@@ -100,11 +114,17 @@ class SimulationConfig:
             if scenario in self.ALL_SCENARIOS:
                 _runtime_flags[scenario] = enabled
                 result[scenario] = enabled
+        _bump_version()
         return result
     
     def reset_flags(self) -> None:
         """Clear all runtime flags (revert to env vars)."""
         _runtime_flags.clear()
+        _bump_version()
+    
+    def has_runtime_flags(self) -> bool:
+        """Check if any runtime override is set (flags come from env vars alone otherwise)."""
+        return bool(_runtime_flags)
     
     def get_all_flags(self) -> Dict[str, bool]:
         """Get current state of all flags (runtime + env)."""
@@ -130,6 +150,10 @@ class SimulationConfig:
             return False
         return self._get_env_flag(env_var)
     
+    def is_forced_success(self, node: str) -> bool:
+        """Check if force_success_all or force_success_<node> is enabled."""
+        return self._check_flag("force_success_all") or self._check_flag(f"force_success_{node}")
+    
     def should_skip(self, node: str) -> bool:
         """
         Check if real checks should be skipped (force success).
@@ -148,9 +172,7 @@ class SimulationConfig:
             return False  # Production always runs real checks
         
         # Explicit force success
-        if self._check_flag("force_success_all"):
-            return True
-        if self._check_flag(f"force_success_{node}"):
+        if self.is_forced_success(node):
             return True
         
         # Check if real checks are explicitly enabled
@@ -0,0 +1,87 @@
+"""
+Checks for the AgentState reducers in app/schema.py.
+Run: python tests/test_schema_reducers.py (or pytest)
+
+Parallel verifiers write the same keys in one step, so each reducer must
+give the same result whatever order the writes are applied in. A channel
+that starts unset stores its first update as-is - possibly a Replace.
+"""
+import sys
+sys.path.insert(0, ".")
+
+from app.schema import (
+    Replace,
+    append_notes,
+    furthest_stage,
+    merge_action_items,
+    merge_error_message,
+    start_pass,
+)
+
+
+def _both_orders(reducer, current, first, second):
+    """Result of applying two parallel writes in either order."""
+    return (
+        reducer(reducer(current, first), second),
+        reducer(reducer(current, second), first),
+    )
+
+
+def test_furthest_stage():
+    # Unset channel: the first write may be stored as a raw Replace
+    assert furthest_stage(None, "DOCS") == "DOCS"
+    assert furthest_stage(Replace("INPUT"), "DOCS") == "DOCS"
+    # Replace resets, even to an earlier stage
+    assert furthest_stage("FINAL", Replace("INPUT")) == "INPUT"
+    a, b = _both_orders(furthest_stage, "INPUT", "BANK", "COMPLIANCE")
+    assert a == b == "COMPLIANCE"
+
+
+def test_merge_error_message():
+    assert merge_error_message(None, "bank bad") == "bank bad"
+    assert merge_error_message(Replace(None), "bank bad") == "bank bad"
+    assert merge_error_message(Replace("old"), "new") == "new; old"
+    assert merge_error_message("old", Replace(None)) is None
+    assert merge_error_message("old", None) is None
+    a, b = _both_orders(merge_error_message, None, "web bad", "bank bad")
+    assert a == b == "bank bad; web bad"
+
+
+def test_append_notes():
+    assert append_notes(None, ["a"]) == ["a"]
+    assert append_notes(Replace(["a"]), ["b"]) == ["a", "b"]
+    assert append_notes(["old"], Replace(["new"])) == ["new"]
+    a, b = _both_orders(append_notes, [], ["doc"], ["bank"])
+    assert sorted(a) == sorted(b) == ["bank", "doc"]
+
+
+def test_merge_action_items():
+    doc, bank = {"id": "d", "title": "doc"}, {"id": "b", "title": "bank"}
+    assert merge_action_items(None, [doc]) == [doc]
+    assert merge_action_items(Replace([doc]), [bank]) == [doc, bank]
+    assert merge_action_items([doc, bank], Replace([])) == []
+    # Re-sent ids replace the old item instead of duplicating it
+    fixed = {"id": "d", "title": "doc (fixed)"}
+    assert merge_action_items([doc, bank], [fixed]) == [bank, fixed]
+    a, b = _both_orders(merge_action_items, [], [doc], [bank])
+    assert sorted(a, key=lambda i: i["id"]) == sorted(b, key=lambda i: i["id"])
+
+
+def test_start_pass():
+    update = {"is_auth_valid": True, "stage": "INPUT"}
+    # Unset channels get plain values (stored as-is by LangGraph)
+    fresh = start_pass(update, {})
+    assert fresh["action_items"] == [] and fresh["error_message"] is None
+    assert fresh["stage"] == "INPUT" and fresh["is_auth_valid"] is True
+    # Set channels get a Replace, so earlier passes don't survive
+    retry = start_pass(update, {"action_items": [{"id": "x"}], "stage": "FINAL"})
+    assert retry["action_items"] == Replace([])
+    assert retry["stage"] == Replace("INPUT")
+    assert retry["error_message"] is None
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_"):
+            check()
+            print(f"ok  {name}")